@@ -0,0 +1,259 @@
+"""Benchmarks des moteurs de calcul, sans interface graphique.
+
+Usage : python benchmarks.py [dijkstra maxflow mincost ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import networkx as nx
+import numpy as np
+
+import interfaceDijkstra as dijkstra
+import interfaceFordFulkerson as fordfulkerson
+import interfaceKruskal as kruskal
+import interfaceWelshPowel as welshpowell
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(title, rows):
+    print(f"\n{title}")
+    reference = rows[0][1]
+    for name, seconds in rows:
+        print(f"  {name:<28} {seconds * 1000:10.1f} ms   x{reference / seconds:6.1f}")
+
+
+def bench_dijkstra():
+    cases = []
+    nodes, edges = dijkstra.generate_random_graph(1000, seed=0)
+    cases.append(("DijkstraApp complete graph, n=1000", nodes, edges))
+    for max_weight in (100, 10 ** 6):
+        nodes, edges = dijkstra.generate_random_graph(100000, 6, seed=0, max_weight=max_weight)
+        cases.append((f"sparse n=100000, deg 6, w<={max_weight}", nodes, edges))
+
+    for title, nodes, edges in cases:
+        G = dijkstra.build_graph(nodes, edges)
+        source = nodes[0]
+        csr = dijkstra.undirected_csr(len(nodes), *edges)
+        rows = [("nx.single_source_dijkstra", timed(nx.single_source_dijkstra, G, source)[0]),
+                ("csr binary heap", timed(dijkstra.csr_dijkstra, *csr, 0)[0])]
+        if dijkstra.integer_weight_bound(csr[2]) <= dijkstra.DIAL_MAX_WEIGHT:
+            rows.append(("Dial buckets", timed(dijkstra.dial_dijkstra, *csr, 0)[0]))
+        n = len(nodes)
+        if len(edges[0]) >= dijkstra.DENSE_THRESHOLD * n * (n - 1) / 2:
+            W = dijkstra.edges_to_matrix(len(nodes), *edges)
+            rows.append(("dense array scan", timed(dijkstra.dense_dijkstra, W, 0)[0]))
+        report(title, rows)
+
+
+def bench_generation():
+    print("\nDijkstraApp.generate_graph, n=100000, average degree 20 (10^6 edges)")
+    seconds, (nodes, edges) = timed(dijkstra.generate_random_graph, 100000, 20, seed=0)
+    print(f"  edge and weight arrays       {seconds * 1000:10.1f} ms")
+    seconds, _ = timed(dijkstra.undirected_csr, len(nodes), *edges)
+    print(f"  CSR adjacency                {seconds * 1000:10.1f} ms")
+    seconds, _ = timed(dijkstra.build_graph, nodes, edges, repeat=1)
+    print(f"  nx.Graph (not built > {dijkstra.MAX_DRAW_VERTICES} vertices) {seconds * 1000:8.1f} ms")
+
+
+def grid_edges(side, seed=0):
+    """Grille side × side à poids entiers, proche d'un réseau routier"""
+    ids = np.arange(side * side).reshape(side, side)
+    u = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    v = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    w = np.random.default_rng(seed).integers(1, 101, size=len(u))
+    return u, v, w
+
+
+def bench_contraction():
+    cases = [("grid 60x60 (road-like)", 3600, grid_edges(60)),
+             ("grid 150x150 (road-like)", 22500, grid_edges(150)),
+             ("DijkstraApp random, n=1000, deg 4", 1000, dijkstra.generate_random_graph(1000, 4, seed=0)[1])]
+    for title, n, edges in cases:
+        csr = dijkstra.undirected_csr(n, *edges)
+        ch = dijkstra.build_contraction_hierarchy(csr, samples=50)
+        print(f"\n{title}")
+        print(f"  preprocessing                {ch.preprocessing_time * 1000:10.1f} ms")
+        print(f"  shortcuts                    {ch.shortcut_count:10d}")
+        print(f"  hierarchy memory (approx.)   {ch.memory_bytes / 1e6:10.2f} MB")
+        print(f"  Dijkstra query               {ch.dijkstra_query_time * 1000:10.2f} ms")
+        print(f"  CH query                     {ch.query_time * 1000:10.2f} ms"
+              f"   x{ch.dijkstra_query_time / ch.query_time:6.1f}")
+
+
+def bench_dynamic_tree():
+    n = 100000
+    _, (u, v, w) = dijkstra.generate_random_graph(n, 6, seed=0)
+    rng = np.random.default_rng(0)
+    tree = dijkstra.DynamicShortestPathTree(dijkstra.adjacency_from_edges(n, u, v, w), 0)
+    repair = 0.0
+    edits = rng.integers(0, len(u), 200)
+    for edge in edits.tolist():
+        a, b = int(u[edge]), int(v[edge])
+        w[edge] = rng.integers(1, 101)
+        start = time.perf_counter()
+        tree.update_edge(a, b, int(w[edge]))
+        repair += time.perf_counter() - start
+    fresh, (dist, _) = timed(dijkstra.csr_dijkstra, *dijkstra.undirected_csr(n, u, v, w), 0)
+    # L'arbre réparé doit donner les distances d'un Dijkstra complet sur le graphe modifié
+    assert np.array_equal(np.array(tree.dist), dist)
+    report(f"shortest-path tree after a weight change, n={n}, deg 6 ({len(edits)} edits)", [
+        ("fresh Dijkstra", fresh),
+        ("incremental repair (mean)", repair / len(edits)),
+    ])
+
+
+def bench_max_flow():
+    for n, max_capacity in ((10000, 100), (10000, 10 ** 6), (100000, 10 ** 6)):
+        tails, heads, capacities, _ = fordfulkerson.generate_valid_network(n, max_capacity, seed=0)
+        network = fordfulkerson.ResidualNetwork(n, tails, heads, capacities)
+        print(f"\nFordFulkersonApp generator, n={n}, {len(tails)} arcs, capacities <= {max_capacity}")
+        reference = None
+        for name, engine in fordfulkerson.ENGINES.items():
+            def solve():
+                network.reset()
+                return engine(network, 0, n - 1)
+            seconds, (flow, stats) = timed(solve, repeat=1)
+            reference = reference or seconds
+            details = ", ".join(f"{value} {key}" for key, value in stats.items())
+            print(f"  {name:<28} {seconds * 1000:10.1f} ms   x{reference / seconds:6.1f}   flow {flow} ({details})")
+
+
+def bench_min_cost_flow():
+    for n in (1000, 10000):
+        tails, heads, capacities, costs = fordfulkerson.generate_valid_network(n, 100, seed=0)
+        network = fordfulkerson.ResidualNetwork(n, tails, heads, capacities, costs)
+        seconds, (flow, cost, stats) = timed(fordfulkerson.min_cost_flow, network, 0, n - 1, repeat=1)
+
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        for u, v, c, w in zip(tails.tolist(), heads.tolist(), capacities.tolist(), costs.tolist()):
+            G.add_edge(u, v, capacity=c, weight=w)
+        G.nodes[0]['demand'] = -flow
+        G.nodes[n - 1]['demand'] = flow
+        simplex_seconds, (simplex_cost, _) = timed(nx.network_simplex, G, repeat=1)
+
+        assert simplex_cost == cost
+        report(f"FordFulkersonApp generator with costs, n={n}, {len(tails)} arcs, "
+               f"flow {flow} at cost {cost} ({stats['augmentations']} augmentations)",
+               [("nx.network_simplex", simplex_seconds),
+                ("successive shortest paths", seconds)])
+
+
+def bench_matching():
+    n = 20000
+    left, right = fordfulkerson.generate_bipartite(n, n, 3, seed=0)
+    seconds, (match_left, stats) = timed(fordfulkerson.hopcroft_karp, n, n, left, right, repeat=1)
+    rows = [("Hopcroft-Karp", seconds)]
+    for title, name in (("max-flow, Dinic", "Dinic"), ("max-flow, push-relabel", "Push-relabel (highest label)")):
+        network = fordfulkerson.matching_network(n, n, left, right)
+        rows.append((title, timed(fordfulkerson.ENGINES[name], network, 0, network.n - 1, repeat=1)[0]))
+    report(f"Bipartite matching, {n} + {n} vertices, {len(left)} edges, "
+           f"{int((match_left >= 0).sum())} pairs ({stats['phases']} phases)", rows)
+
+
+def bench_mst():
+    rng = np.random.default_rng(0)
+    cases = []
+    for n in (500, 1000, 4473, 8000):
+        u, v, w = kruskal.generate_edge_arrays(n, seed=0)
+        cases.append((f"complete graph n={n}, integer weights 1-100 (window generator)", n, u, v, w))
+        cases.append((f"complete graph n={n}, random real weights", n, u, v, rng.random(len(u))))
+    for n in (10 ** 6, 2 * 10 ** 6):
+        m = 10 ** 7
+        cases.append((f"sparse n={n}, m={m}", n, rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m)))
+
+    for title, n, u, v, w in cases:
+        rows = []
+        for engine in kruskal.MST_ENGINES[1:]:
+            if engine == "Prim (dense)" and n > kruskal.PRIM_MAX_VERTICES:
+                continue
+            rows.append((engine, timed(kruskal.minimum_spanning_arrays, n, u, v, w, engine, repeat=1)[0]))
+        report(f"{title} (Auto picks {kruskal.select_mst_engine(n, len(u), np.issubdtype(w.dtype, np.integer))})", rows)
+
+
+def bench_external_mst():
+    n, m = 10 ** 6, 3 * 10 ** 7
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "edges.bin")
+        kruskal.write_edge_file(path, rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m))
+        rows = []
+        for budget in (32, 64, 256):
+            seconds, result = timed(kruskal.external_kruskal, path, budget * 1024 * 1024, repeat=1)
+            rows.append((f"budget {budget} MB ({result[4]['runs']} runs)", seconds))
+        report(f"out-of-core Kruskal n={n}, m={m} ({os.path.getsize(path) >> 20} MB file)", rows)
+
+
+def bench_euclidean_mst():
+    for n in (10 ** 5, 10 ** 6):
+        points = kruskal.generate_points(n, seed=0)
+        rows = []
+        for engine in ("Borůvka", "Kruskal"):
+            seconds, result = timed(kruskal.euclidean_mst, points, kruskal.EUCLIDEAN_NEIGHBORS, engine, repeat=1)
+            rows.append((f"{engine} (kNN {result[4]['knn seconds']:.2f} s)", seconds))
+        report(f"Euclidean MST of {n} uniform points, {kruskal.EUCLIDEAN_NEIGHBORS} nearest neighbours", rows)
+
+
+def bench_coloring():
+    n = 1500
+    u, v = welshpowell.generate_random_arrays(n, seed=0)
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(zip(u.tolist(), v.tolist()))
+    indptr, indices = welshpowell.adjacency_arrays(n, u, v)
+    report(f"Welch-Powell, n={n}, m={len(u)}", [
+        ("networkx", timed(welshpowell.welch_powell, G, repeat=1)[0]),
+        ("CSR", timed(welshpowell.welch_powell_arrays, n, indptr, indices)[0]),
+    ])
+
+    rng = np.random.default_rng(0)
+    cases = [("dense n=6300", 6300, *welshpowell.generate_random_arrays(6300, seed=0))]
+    n, m = 10 ** 6, 10 ** 7
+    cases.append((f"sparse n={n}", n, rng.integers(0, n, m), rng.integers(0, n, m)))
+    for title, n, u, v in cases:
+        loops = u == v
+        indptr, indices = welshpowell.adjacency_arrays(n, u[~loops], v[~loops])
+        rows = []
+        for name, engine in welshpowell.COLORING_ENGINES.items():
+            seconds, colors = timed(engine, n, indptr, indices, repeat=1)
+            rows.append((f"{name} ({int(colors.max()) + 1} colors)", seconds))
+        report(f"Coloring engines, {title}, m={int(np.count_nonzero(~loops))}", rows)
+
+
+BENCHMARKS = {
+    'generation': bench_generation,
+    'dijkstra': bench_dijkstra,
+    'contraction': bench_contraction,
+    'dynamic': bench_dynamic_tree,
+    'maxflow': bench_max_flow,
+    'mincost': bench_min_cost_flow,
+    'matching': bench_matching,
+    'mst': bench_mst,
+    'external': bench_external_mst,
+    'euclidean': bench_euclidean_mst,
+    'coloring': bench_coloring,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Usage : python benchmarks.py [{' '.join(BENCHMARKS)}]")
+        unknown = [name for name in unknown if name not in ('-h', '--help')]
+        if unknown:
+            print(f"Unknown benchmark(s): {', '.join(unknown)}")
+        sys.exit(2 if unknown else 0)
+    for name in names:
+        BENCHMARKS[name]()
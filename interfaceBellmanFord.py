@@ -4,7 +4,202 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
 import random
+import time
+from interfaceDijkstra import edges_to_csr, csr_dijkstra, unwind_path, format_distance
+
+# En dessous de ce nombre moyen d'arcs par sommet, le mode automatique choisit SPFA
+SPFA_MAX_AVG_DEGREE = 8
+ENGINES = ["Auto", "Bellman-Ford (vectorized)", "SPFA (queue)"]
+
+
+def graph_to_edge_arrays(G, nodes, weight='weight'):
+    """Tableaux (src, dst, w) des arcs de G, les sommets étant indexés comme nodes"""
+    index = {node: i for i, node in enumerate(nodes)}
+    src, dst, w = [], [], []
+    for u, v, data in G.edges(data=weight, default=1):
+        src.append(index[u])
+        dst.append(index[v])
+        w.append(data)
+    return np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64), np.array(w, dtype=float)
+
+
+def extract_cycle(pred, start):
+    """Remonte les prédécesseurs depuis start jusqu'à tomber dans un cycle et le retourne"""
+    n = len(pred)
+    v = start
+    for _ in range(n):
+        v = pred[v]
+        if v == -1:
+            return None
+    cycle = [v]
+    u = pred[v]
+    while u != v:
+        cycle.append(u)
+        u = pred[u]
+    cycle.append(v)
+    cycle.reverse()
+    return cycle
+
+
+def bellman_ford_arrays(n, src, dst, w, source):
+    """Bellman-Ford vectorisé : chaque passe relâche tous les arcs d'un coup (minimum dispersé).
+
+    S'arrête dès qu'une passe ne change rien. Retourne (dist, pred, cycle) où cycle est la liste
+    des sommets d'un cycle absorbant atteignable depuis source, ou None.
+    """
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[source] = 0.0
+    improved = np.zeros(n, dtype=bool)
+    for _ in range(n):
+        candidates = dist[src] + w
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, dst, candidates)
+        improved = new_dist < dist
+        if not improved.any():
+            return dist, pred, None
+        best = improved[dst] & (candidates == new_dist[dst])
+        pred[dst[best]] = src[best]
+        dist = new_dist
+
+    # Encore des améliorations après n passes : il existe un cycle absorbant
+    cycle = extract_cycle(pred.tolist(), int(np.flatnonzero(improved)[0]))
+    return dist, pred, cycle
+
+
+def spfa(n, indptr, indices, weights, source):
+    """Bellman-Ford à file (SPFA), intéressant sur les graphes creux ; même contrat que bellman_ford_arrays"""
+    indptr, indices, weights = indptr.tolist(), indices.tolist(), weights.tolist()
+    inf = float('inf')
+    dist = [inf] * n
+    pred = [-1] * n
+    length = [0] * n
+    in_queue = [False] * n
+    dist[source] = 0
+    queue = deque([source])
+    in_queue[source] = True
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        d = dist[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            alt = d + weights[e]
+            if alt < dist[v]:
+                dist[v] = alt
+                pred[v] = u
+                length[v] = length[u] + 1
+                if length[v] >= n:
+                    return np.array(dist), np.array(pred, dtype=np.int64), extract_cycle(pred, v)
+                if not in_queue[v]:
+                    in_queue[v] = True
+                    queue.append(v)
+    return np.array(dist), np.array(pred, dtype=np.int64), None
+
+
+def topological_order(n, src, dst):
+    """Ordre topologique (Kahn) des sommets, ou None si le graphe contient un circuit"""
+    indptr, indices, _ = edges_to_csr(n, src, dst, np.zeros(len(src)))
+    indptr, indices = indptr.tolist(), indices.tolist()
+    in_degree = np.bincount(dst, minlength=n).tolist()
+    queue = deque(v for v in range(n) if in_degree[v] == 0)
+    order = []
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                queue.append(v)
+    return order if len(order) == n else None
+
+
+def dag_shortest_paths(n, indptr, indices, weights, order, source):
+    """Plus courts chemins en O(V + E) sur un graphe acyclique, par relâchement dans l'ordre topologique"""
+    indptr, indices, weights = indptr.tolist(), indices.tolist(), weights.tolist()
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    dist[source] = 0
+    for u in order[order.index(source):]:
+        d = dist[u]
+        if d == float('inf'):
+            continue
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            if d + weights[e] < dist[v]:
+                dist[v] = d + weights[e]
+                pred[v] = u
+    return np.array(dist), np.array(pred, dtype=np.int64), None
+
+
+_worker_shared = None
+
+
+def _init_johnson_worker(blocks):
+    """Attache les tableaux CSR repondérés placés en mémoire partagée par le processus principal"""
+    global _worker_shared
+    handles = [shared_memory.SharedMemory(name=name) for name, _, _ in blocks]
+    arrays = [np.ndarray(shape, dtype=dtype, buffer=handle.buf)
+              for handle, (_, shape, dtype) in zip(handles, blocks)]
+    _worker_shared = (handles, arrays)
+
+
+def _johnson_rows(sources):
+    indptr, indices, weights = _worker_shared[1]
+    rows = [csr_dijkstra(indptr, indices, weights, s) for s in sources]
+    return sources, np.array([d for d, _ in rows]), np.array([p for _, p in rows])
+
+
+def johnson_all_pairs(n, src, dst, w, processes=None):
+    """Algorithme de Johnson : potentiels par Bellman-Ford depuis une source virtuelle,
+    repondération, puis un Dijkstra par source réparti sur un pool de processus.
+
+    Retourne (dist, pred, cycle) : matrices n×n (pred[s, v] = prédécesseur de v depuis s)
+    ou (None, None, cycle) si le graphe contient un cycle absorbant.
+    """
+    virtual = n
+    h, _, cycle = bellman_ford_arrays(n + 1,
+                                      np.concatenate([src, np.full(n, virtual)]),
+                                      np.concatenate([dst, np.arange(n)]),
+                                      np.concatenate([w, np.zeros(n)]),
+                                      virtual)
+    if cycle is not None:
+        return None, None, cycle
+    h = h[:n]
+    # Poids repondérés, positifs ou nuls
+    reweighted = np.maximum(w + h[src] - h[dst], 0.0)
+    csr = edges_to_csr(n, src, dst, reweighted)
+
+    blocks, handles = [], []
+    try:
+        for array in csr:
+            handle = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=handle.buf)[:] = array
+            handles.append(handle)
+            blocks.append((handle.name, array.shape, array.dtype.str))
+
+        dist = np.empty((n, n))
+        pred = np.empty((n, n), dtype=np.int64)
+        chunks = [list(range(i, min(i + 32, n))) for i in range(0, n, 32)]
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_johnson_worker,
+                                 initargs=(blocks,)) as pool:
+            for sources, dist_rows, pred_rows in pool.map(_johnson_rows, chunks):
+                dist[sources[0]:sources[-1] + 1] = dist_rows
+                pred[sources[0]:sources[-1] + 1] = pred_rows
+    finally:
+        for handle in handles:
+            handle.close()
+            handle.unlink()
+
+    # Retour aux poids d'origine : d(s, v) = d'(s, v) - h(s) + h(v)
+    dist += h[None, :] - h[:, None]
+    return dist, pred, None
 
 
 class BellmanFordApp:
@@ -33,6 +228,12 @@ class BellmanFordApp:
         # Variables globales
         self.G = None
         self.sommets = []
+        self.edge_arrays = None
+        # Matrices de Johnson (graphe, dist, pred) lues par les sélections Source/Target suivantes
+        self.all_pairs = None
+        # Résultats (dist, pred, cycle, moteur, durée) par source pour le graphe courant
+        self.sssp_cache = {}
+        self.topo_order = None
         
         # Container principal
         self.main_container = tk.Frame(self.top, bg=self.colors['bg'], padx=20, pady=20)
@@ -120,6 +321,24 @@ class BellmanFordApp:
                                      relief="flat",
                                      width=40)
         self.vertices_entry.pack(side="left", padx=10)
+
+        self.negative_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(vertex_frame,
+                       text="Allow negative weights",
+                       variable=self.negative_var,
+                       font=("Helvetica Neue", 12),
+                       bg=self.colors['bg'],
+                       fg=self.colors['secondary'],
+                       activebackground=self.colors['bg']).pack(side="left", padx=10)
+
+        self.acyclic_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(vertex_frame,
+                       text="Acyclic (DAG)",
+                       variable=self.acyclic_var,
+                       font=("Helvetica Neue", 12),
+                       bg=self.colors['bg'],
+                       fg=self.colors['secondary'],
+                       activebackground=self.colors['bg']).pack(side="left", padx=10)
         
         self.generate_button = tk.Button(vertex_frame,
                                        text="Generate Graph",
@@ -170,6 +389,21 @@ class BellmanFordApp:
                                         style='Custom.TCombobox',
                                         width=15)
         self.target_combo.pack(side="left", padx=10)
+
+        tk.Label(path_frame,
+                text="Engine:",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(20, 10))
+
+        self.engine_combo = ttk.Combobox(path_frame,
+                                        state="readonly",
+                                        values=ENGINES,
+                                        font=("Helvetica Neue", 12),
+                                        style='Custom.TCombobox',
+                                        width=22)
+        self.engine_combo.current(0)
+        self.engine_combo.pack(side="left", padx=10)
         
         self.calculate_button = tk.Button(path_frame,
                                         text="Find Shortest Path",
@@ -186,6 +420,21 @@ class BellmanFordApp:
                                         cursor="hand2")
         self.calculate_button.pack(side="right", padx=10)
 
+        self.johnson_button = tk.Button(path_frame,
+                                        text="All Pairs (Johnson)",
+                                        command=self.execute_johnson,
+                                        font=("Helvetica Neue", 12, "bold"),
+                                        bg=self.colors['rose'],
+                                        fg="white",
+                                        activebackground=self.colors['secondary'],
+                                        activeforeground="white",
+                                        relief="flat",
+                                        bd=0,
+                                        padx=20,
+                                        pady=8,
+                                        cursor="hand2")
+        self.johnson_button.pack(side="right", padx=10)
+
     def create_result_section(self):
         self.result_var = StringVar()
         self.result_var.set("Ready to generate graph")
@@ -218,12 +467,18 @@ class BellmanFordApp:
             
             for sommet in self.sommets:
                 self.G.add_node(sommet)
+            low = -5 if self.negative_var.get() else 1
+            acyclic = self.acyclic_var.get()
             for i in range(n_vertices):
                 for j in range(i + 1, n_vertices):
-                    if random.choice([True, False]):
-                        self.G.add_edge(self.sommets[i], self.sommets[j], weight=random.randint(1, 10))
+                    if acyclic or random.choice([True, False]):
+                        self.G.add_edge(self.sommets[i], self.sommets[j], weight=random.randint(low, 10))
                     else:
-                        self.G.add_edge(self.sommets[j], self.sommets[i], weight=random.randint(1, 10))
+                        self.G.add_edge(self.sommets[j], self.sommets[i], weight=random.randint(low, 10))
+            self.edge_arrays = graph_to_edge_arrays(self.G, self.sommets)
+            self.all_pairs = None
+            self.sssp_cache = {}
+            self.topo_order = topological_order(n_vertices, self.edge_arrays[0], self.edge_arrays[1])
             
             self.source_combo['values'] = self.sommets
             self.target_combo['values'] = self.sommets
@@ -234,6 +489,25 @@ class BellmanFordApp:
         except ValueError as e:
             self.result_var.set(f"Error: {str(e)}")
 
+    def execute_johnson(self):
+        if self.G is None:
+            self.result_var.set("Please generate a graph first")
+            return
+
+        self.result_var.set("Computing all-pairs shortest paths (Johnson)...")
+        self.main_container.update()
+
+        n = len(self.sommets)
+        dist, pred, cycle = johnson_all_pairs(n, *self.edge_arrays)
+        if cycle is not None:
+            self.show_cycle(cycle, "no all-pairs solution")
+            return
+
+        self.all_pairs = (self.G, dist, pred)
+        reachable = int(np.isfinite(dist).sum()) - n
+        self.result_var.set(f"All-pairs distances ready ({reachable} reachable pairs). "
+                            f"Select source and target vertices.")
+
     def execute_bellman_ford(self):
         source = self.source_combo.get()
         target = self.target_combo.get()
@@ -243,24 +517,71 @@ class BellmanFordApp:
             return
         
         try:
-            # Get both distances and paths from the Bellman-Ford algorithm
-            distance, path = nx.single_source_bellman_ford(self.G, source)
-            
-            if target not in path:
-                self.result_var.set("No path exists between the selected vertices")
-                self.draw_graph()  # Redraw the graph without highlighting any path
+            n = len(self.sommets)
+            s, t = self.sommets.index(source), self.sommets.index(target)
+            if self.all_pairs is not None and self.all_pairs[0] is self.G:
+                _, all_dist, all_pred = self.all_pairs
+                self.show_path(all_dist[s], all_pred[s], s, t, "Johnson all-pairs matrix")
                 return
-            
-            shortest_path = path[target]
-            path_edges = list(zip(shortest_path[:-1], shortest_path[1:]))
-            self.draw_graph(path_edges)
-            
-            path_str = " → ".join(shortest_path)
-            self.result_var.set(f"Shortest path: {path_str}\nTotal distance: {distance[target]} units")
+
+            # La solution d'une source donne les distances vers toutes les cibles : on la garde
+            if s in self.sssp_cache:
+                dist, pred, cycle, engine, elapsed = self.sssp_cache[s]
+                engine = f"{engine}, cached"
+            else:
+                dist, pred, cycle, engine, elapsed = self.solve_single_source(s)
+                self.sssp_cache[s] = (dist, pred, cycle, engine, elapsed)
+            engine = f"{engine}, {elapsed * 1000:.2f} ms"
+
+            if cycle is not None:
+                # Cycle absorbant : on le met en évidence au lieu d'échouer
+                self.show_cycle(cycle, engine)
+                return
+
+            self.show_path(dist, pred, s, t, engine)
             
         except nx.NetworkXError as e:
             self.result_var.set(f"Error: {str(e)}")
 
+    def solve_single_source(self, s):
+        n = len(self.sommets)
+        src, dst, w = self.edge_arrays
+        start = time.perf_counter()
+        if self.topo_order is not None:
+            engine = "DAG topological order"
+            dist, pred, cycle = dag_shortest_paths(n, *edges_to_csr(n, src, dst, w), self.topo_order, s)
+        else:
+            engine = self.engine_combo.get()
+            if engine == "Auto":
+                engine = ENGINES[2] if len(src) < SPFA_MAX_AVG_DEGREE * n else ENGINES[1]
+            if engine == ENGINES[2]:
+                dist, pred, cycle = spfa(n, *edges_to_csr(n, src, dst, w), s)
+            else:
+                dist, pred, cycle = bellman_ford_arrays(n, src, dst, w, s)
+        return dist, pred, cycle, engine, time.perf_counter() - start
+
+    def show_cycle(self, cycle, engine):
+        cycle_nodes = [self.sommets[i] for i in cycle]
+        cycle_edges = list(zip(cycle_nodes[:-1], cycle_nodes[1:]))
+        total = sum(self.G[u][v]['weight'] for u, v in cycle_edges)
+        self.draw_graph(cycle_edges)
+        self.result_var.set(f"Negative cycle detected: {' → '.join(cycle_nodes)}\n"
+                            f"Cycle weight: {total} units ({engine})")
+
+    def show_path(self, dist, pred, s, t, engine):
+        if not np.isfinite(dist[t]):
+            self.result_var.set("No path exists between the selected vertices")
+            self.draw_graph()  # Redraw the graph without highlighting any path
+            return
+
+        shortest_path = [self.sommets[i] for i in unwind_path(pred, s, t)]
+        path_edges = list(zip(shortest_path[:-1], shortest_path[1:]))
+        self.draw_graph(path_edges)
+
+        path_str = " → ".join(shortest_path)
+        self.result_var.set(f"Shortest path: {path_str}\n"
+                            f"Total distance: {format_distance(dist[t])} units ({engine})")
+
 
     def draw_graph(self, highlighted_path=[]):
         for widget in self.graph_frame.winfo_children():
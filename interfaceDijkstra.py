@@ -5,9 +5,736 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from tkinter import Tk, Label, Entry, Button, Frame, Toplevel
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import heapq
+import os
+import tempfile
+import time
+import numpy as np
 import random
 
 
+# Au-delà de cette densité (arêtes / arêtes possibles), la matrice dense est utilisée
+DENSE_THRESHOLD = 0.5
+# Au-delà de ce nombre de sommets, le graphe n'est plus dessiné
+MAX_DRAW_VERTICES = 100
+# Au-delà de cette taille (octets), les matrices toutes paires sont placées dans un fichier mappé
+MEMMAP_THRESHOLD = 512 * 1024 * 1024
+# Poids entier maximal pour lequel l'algorithme de Dial (C + 1 seaux) est préféré au tas binaire
+DIAL_MAX_WEIGHT = 1000
+
+
+def dense_dijkstra(W, source, target=None):
+    """Dijkstra en O(n²) par balayage de tableau (sans tas) sur une matrice de poids.
+
+    Retourne les tableaux (dist, pred) indexés par sommet ; pred vaut -1 pour la source
+    et les sommets non atteints. Si target est donné, la recherche s'arrête dès qu'il est fixé.
+    """
+    n = W.shape[0]
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    dist[source] = 0.0
+
+    for _ in range(n):
+        candidates = np.where(visited, np.inf, dist)
+        u = int(np.argmin(candidates))
+        if candidates[u] == np.inf:
+            break
+        visited[u] = True
+        if u == target:
+            break
+        alt = dist[u] + W[u]
+        better = (alt < dist) & ~visited
+        dist[better] = alt[better]
+        pred[better] = u
+
+    return dist, pred
+
+
+def unwind_path(pred, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(int(pred[path[-1]]))
+    path.reverse()
+    return path
+
+
+def node_indices(nodes, index, *wanted):
+    if index is None:
+        index = {node: i for i, node in enumerate(nodes)}
+    for node in wanted:
+        if node not in index:
+            raise nx.NodeNotFound(f"Node {node} not found in graph")
+    return [index[node] for node in wanted]
+
+
+def dense_single_source_dijkstra(nodes, W, source, target, index=None):
+    """Même contrat (distance, chemin) que nx.single_source_dijkstra avec une cible"""
+    s, t = node_indices(nodes, index, source, target)
+    dist, pred = dense_dijkstra(W, s, t)
+    if dist[t] == np.inf:
+        raise nx.NetworkXNoPath(f"No path to {target}.")
+    path = [nodes[i] for i in unwind_path(pred, s, t)]
+    return float(dist[t]), path
+
+
+def format_distance(distance):
+    """Affiche les distances entières sans décimale"""
+    return int(distance) if float(distance).is_integer() else distance
+
+
+def graph_to_csr(G, nodes, weight='weight'):
+    """Listes d'adjacence compactes (indptr, indices, weights) indexées comme nodes"""
+    index = {node: i for i, node in enumerate(nodes)}
+    directed = G.is_directed()
+    tails, heads, weights = [], [], []
+    for u, v, w in G.edges(data=weight, default=1):
+        tails.append(index[u])
+        heads.append(index[v])
+        weights.append(w)
+        if not directed:
+            tails.append(index[v])
+            heads.append(index[u])
+            weights.append(w)
+    return edges_to_csr(len(nodes), np.array(tails, dtype=np.int64),
+                        np.array(heads, dtype=np.int64), np.array(weights, dtype=float))
+
+
+def edges_to_csr(n, tails, heads, weights):
+    order = np.argsort(tails)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+    return indptr, heads[order], weights[order]
+
+
+def csr_dijkstra(indptr, indices, weights, source, target=None):
+    """Dijkstra avec tas binaire sur un graphe CSR ; retourne les tableaux (dist, pred)"""
+    n = len(indptr) - 1
+    indptr, indices, weights = indptr.tolist(), indices.tolist(), weights.tolist()
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    done = [False] * n
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            alt = d + weights[e]
+            if alt < dist[v]:
+                dist[v] = alt
+                pred[v] = u
+                heapq.heappush(heap, (alt, v))
+    return np.array(dist), np.array(pred, dtype=np.int64)
+
+
+def integer_weight_bound(weights):
+    """Poids maximal si tous les poids sont des entiers positifs ou nuls, sinon None"""
+    if len(weights) == 0:
+        return 0
+    if weights.min() < 0 or not np.all(np.mod(weights, 1) == 0):
+        return None
+    return int(weights.max())
+
+
+def dial_dijkstra(indptr, indices, weights, source, target=None):
+    """Algorithme de Dial : file à C + 1 seaux circulaires pour des poids entiers ≤ C"""
+    n = len(indptr) - 1
+    n_buckets = integer_weight_bound(weights) + 1
+    indptr, indices = indptr.tolist(), indices.tolist()
+    weights = weights.astype(np.int64).tolist()
+    inf = float('inf')
+    dist = [inf] * n
+    pred = [-1] * n
+    dist[source] = 0
+    buckets = [[] for _ in range(n_buckets)]
+    buckets[0].append(source)
+    pending = 1
+    d = 0
+    while pending:
+        bucket = buckets[d % n_buckets]
+        while not bucket:
+            d += 1
+            bucket = buckets[d % n_buckets]
+        u = bucket.pop()
+        pending -= 1
+        if dist[u] != d:
+            continue  # entrée périmée
+        if u == target:
+            break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            alt = d + weights[e]
+            if alt < dist[v]:
+                dist[v] = alt
+                pred[v] = u
+                buckets[alt % n_buckets].append(v)
+                pending += 1
+    return np.array(dist, dtype=float), np.array(pred, dtype=np.int64)
+
+
+def bucket_dijkstra(indptr, indices, weights, source, target=None):
+    """Dial pour les petits poids entiers ; au-delà de DIAL_MAX_WEIGHT, on retombe sur le tas binaire"""
+    if integer_weight_bound(weights) <= DIAL_MAX_WEIGHT:
+        return dial_dijkstra(indptr, indices, weights, source, target)
+    return csr_dijkstra(indptr, indices, weights, source, target)
+
+
+def csr_single_source_dijkstra(nodes, csr, source, target, engine=csr_dijkstra, index=None):
+    """Même contrat (distance, chemin) que nx.single_source_dijkstra pour un moteur CSR"""
+    s, t = node_indices(nodes, index, source, target)
+    dist, pred = engine(*csr, s, t)
+    if dist[t] == np.inf:
+        raise nx.NetworkXNoPath(f"No path to {target}.")
+    path = [nodes[i] for i in unwind_path(pred, s, t)]
+    return float(dist[t]), path
+
+
+class ContractionHierarchy:
+    """Hiérarchie de contraction pour un graphe non orienté donné en CSR.
+
+    La construction ordonne les sommets (différence d'arêtes, mise à jour paresseuse) et ajoute
+    les raccourcis nécessaires ; les requêtes font une recherche bidirectionnelle montante puis
+    déplient les raccourcis.
+    """
+
+    def __init__(self, indptr, indices, weights, witness_settle_limit=60):
+        self.n = len(indptr) - 1
+        self.witness_settle_limit = witness_settle_limit
+        start = time.perf_counter()
+        self._build(indptr.tolist(), indices.tolist(), weights.tolist())
+        self.preprocessing_time = time.perf_counter() - start
+
+    def _witness_distances(self, adj, source, excluded, max_dist):
+        """Dijkstra limitée depuis source dans le graphe restant, sans passer par excluded"""
+        dist = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        while heap and settled < self.witness_settle_limit:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if d > max_dist:
+                break
+            settled += 1
+            for v, (w, _) in adj[u].items():
+                if v == excluded:
+                    continue
+                alt = d + w
+                if alt < dist.get(v, float('inf')):
+                    dist[v] = alt
+                    heapq.heappush(heap, (alt, v))
+        return dist
+
+    def _shortcuts(self, adj, v):
+        """Raccourcis (u, w, poids) nécessaires si v est contracté"""
+        neighbours = list(adj[v].items())
+        shortcuts = []
+        for i, (u, (wu, _)) in enumerate(neighbours):
+            others = neighbours[i + 1:]
+            if not others:
+                continue
+            max_dist = wu + max(ww for _, (ww, _) in others)
+            witness = self._witness_distances(adj, u, v, max_dist)
+            for w, (ww, _) in others:
+                via = wu + ww
+                if witness.get(w, float('inf')) > via:
+                    shortcuts.append((u, w, via))
+        return shortcuts
+
+    def _priority(self, adj, v, deleted):
+        """Différence d'arêtes + voisins déjà contractés ; retourne aussi les raccourcis"""
+        shortcuts = self._shortcuts(adj, v)
+        return len(shortcuts) - len(adj[v]) + deleted[v], shortcuts
+
+    def _build(self, indptr, indices, weights):
+        n = self.n
+        # adj[u][v] = (poids, sommet milieu ou -1 pour une arête d'origine)
+        adj = [dict() for _ in range(n)]
+        for u in range(n):
+            for e in range(indptr[u], indptr[u + 1]):
+                v, w = indices[e], weights[e]
+                if v != u and w < adj[u].get(v, (float('inf'), -1))[0]:
+                    adj[u][v] = (w, -1)
+
+        up = [dict() for _ in range(n)]
+        deleted = [0] * n
+        self.rank = [0] * n
+        heap = [(self._priority(adj, v, deleted)[0], v) for v in range(n)]
+        heapq.heapify(heap)
+        self.shortcut_count = 0
+        order = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            # Mise à jour paresseuse : on recalcule la priorité avant de contracter
+            priority, shortcuts = self._priority(adj, v, deleted)
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, v))
+                continue
+
+            for u, w, via in shortcuts:
+                if via < adj[u].get(w, (float('inf'), -1))[0]:
+                    adj[u][w] = (via, v)
+                    adj[w][u] = (via, v)
+                    self.shortcut_count += 1
+            self.rank[v] = order
+            order += 1
+            for u, edge in adj[v].items():
+                up[v][u] = edge
+                del adj[u][v]
+                deleted[u] += 1
+            adj[v] = {}
+
+        self.up = up
+        self.memory_bytes = sum(len(edges) for edges in up) * 3 * 8 + n * 8
+
+    def _upward_search(self, dist, pred, heap):
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            return
+        for v, (w, _) in self.up[u].items():
+            alt = d + w
+            if alt < dist.get(v, float('inf')):
+                dist[v] = alt
+                pred[v] = u
+                heapq.heappush(heap, (alt, v))
+
+    def _unpack(self, a, b):
+        """Déplie l'arête (a, b) de la hiérarchie en arêtes d'origine"""
+        path = [a]
+        stack = [(a, b)]
+        while stack:
+            x, y = stack.pop()
+            low, high = (x, y) if self.rank[x] < self.rank[y] else (y, x)
+            middle = self.up[low][high][1]
+            if middle == -1:
+                path.append(y)
+            else:
+                stack.append((middle, y))
+                stack.append((x, middle))
+        return path
+
+    def query(self, source, target):
+        """Retourne (distance, chemin en indices) ; distance infinie si aucun chemin"""
+        dist = [{source: 0.0}, {target: 0.0}]
+        pred = [{}, {}]
+        heaps = [[(0.0, source)], [(0.0, target)]]
+        best, meet = (0.0, source) if source == target else (float('inf'), -1)
+        while heaps[0] or heaps[1]:
+            side = 0 if not heaps[1] or (heaps[0] and heaps[0][0][0] <= heaps[1][0][0]) else 1
+            if heaps[side][0][0] >= best:
+                heaps[side] = []
+                continue
+            u = heaps[side][0][1]
+            self._upward_search(dist[side], pred[side], heaps[side])
+            if u in dist[1 - side] and dist[side][u] + dist[1 - side][u] < best:
+                best, meet = dist[side][u] + dist[1 - side][u], u
+
+        if meet == -1:
+            return float('inf'), []
+        half = [meet]
+        while half[-1] != source:
+            half.append(pred[0][half[-1]])
+        half.reverse()
+        node = meet
+        while node != target:
+            half.append(pred[1][node])
+            node = half[-1]
+        path = [source]
+        for a, b in zip(half[:-1], half[1:]):
+            path.extend(self._unpack(a, b)[1:])
+        return best, path
+
+
+def ch_single_source_dijkstra(nodes, ch, csr, source, target, index=None):
+    """Même contrat (distance, chemin) que nx.single_source_dijkstra pour une requête CH"""
+    s, t = node_indices(nodes, index, source, target)
+    _, path = ch.query(s, t)
+    if not path:
+        raise nx.NetworkXNoPath(f"No path to {target}.")
+    # Somme des poids d'origine le long du chemin, dans l'ordre, comme networkx
+    indptr, indices, weights = csr
+    distance = 0.0
+    for a, b in zip(path[:-1], path[1:]):
+        row = slice(indptr[a], indptr[a + 1])
+        distance += weights[row][indices[row] == b].min()
+    return float(distance), [nodes[i] for i in path]
+
+
+def build_contraction_hierarchy(csr, samples=20, seed=0):
+    """Construit la hiérarchie et mesure le gain par requête sur des paires aléatoires"""
+    ch = ContractionHierarchy(*csr)
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(ch.n), rng.randrange(ch.n)) for _ in range(samples)]
+    # Moteur de référence choisi une fois, comme le ferait bucket_dijkstra à chaque appel
+    bound = integer_weight_bound(csr[2])
+    engine = dial_dijkstra if bound is not None and bound <= DIAL_MAX_WEIGHT else csr_dijkstra
+    start = time.perf_counter()
+    for s, t in pairs:
+        engine(*csr, s, t)
+    ch.dijkstra_query_time = (time.perf_counter() - start) / samples
+    start = time.perf_counter()
+    for s, t in pairs:
+        ch.query(s, t)
+    ch.query_time = (time.perf_counter() - start) / samples
+    return ch
+
+
+def floyd_warshall(W, dist, pred, block_rows=256):
+    """Floyd–Warshall vectorisé, écrit dans dist et pred (tableaux n×n, éventuellement mappés).
+
+    pred[i, j] est le prédécesseur de j sur le plus court chemin i → j (-1 si aucun).
+    """
+    n = W.shape[0]
+    for start in range(0, n, block_rows):
+        rows = slice(start, min(start + block_rows, n))
+        block = W[rows].copy()
+        block[np.arange(rows.stop - start), np.arange(start, rows.stop)] = 0.0
+        dist[rows] = block
+        pred[rows] = np.where(np.isfinite(block), np.arange(start, rows.stop)[:, None], -1)
+        pred[np.arange(start, rows.stop), np.arange(start, rows.stop)] = -1
+
+    for k in range(n):
+        row_k = np.array(dist[k])
+        pred_k = np.array(pred[k])
+        for start in range(0, n, block_rows):
+            rows = slice(start, min(start + block_rows, n))
+            via = dist[rows, k][:, None] + row_k[None, :]
+            block = dist[rows]
+            better = via < block
+            if better.any():
+                block[better] = via[better]
+                pred_block = pred[rows]
+                pred_block[better] = np.broadcast_to(pred_k, via.shape)[better]
+                dist[rows] = block
+                pred[rows] = pred_block
+
+
+_worker_csr = None
+
+
+def _init_sssp_worker(indptr, indices, weights):
+    global _worker_csr
+    _worker_csr = (indptr, indices, weights)
+
+
+def _sssp_rows(sources):
+    rows = [csr_dijkstra(*_worker_csr, s) for s in sources]
+    return sources, np.array([d for d, _ in rows]), np.array([p for _, p in rows])
+
+
+class ShortestPathCache:
+    """Distances et prédécesseurs toutes paires pour un graphe donné.
+
+    Les requêtes Source/Target se résument ensuite à une lecture et au déroulement du chemin.
+    """
+
+    def __init__(self, key, nodes, W=None, csr=None):
+        self.key = key
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.W = W
+        self.csr = csr
+        self.dist = None
+        self.pred = None
+        self._tmpdir = None
+
+    def _allocate(self, n):
+        if 2 * n * n * 8 <= MEMMAP_THRESHOLD:
+            return np.empty((n, n)), np.empty((n, n), dtype=np.int64)
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="apsp_")
+        dist = np.lib.format.open_memmap(os.path.join(self._tmpdir.name, "dist.npy"),
+                                         mode="w+", dtype=np.float64, shape=(n, n))
+        pred = np.lib.format.open_memmap(os.path.join(self._tmpdir.name, "pred.npy"),
+                                         mode="w+", dtype=np.int64, shape=(n, n))
+        return dist, pred
+
+    def compute(self, processes=None):
+        n = len(self.nodes)
+        self.dist, self.pred = self._allocate(n)
+        if self.W is not None:
+            floyd_warshall(self.W, self.dist, self.pred)
+            return self
+
+        chunks = [list(range(i, min(i + 64, n))) for i in range(0, n, 64)]
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_sssp_worker,
+                                 initargs=self.csr) as pool:
+            for sources, dist_rows, pred_rows in pool.map(_sssp_rows, chunks):
+                self.dist[sources[0]:sources[-1] + 1] = dist_rows
+                self.pred[sources[0]:sources[-1] + 1] = pred_rows
+        return self
+
+    def query(self, source, target):
+        s, t = node_indices(self.nodes, self.index, source, target)
+        if not np.isfinite(self.dist[s, t]):
+            raise nx.NetworkXNoPath(f"No path to {target}.")
+        path = [self.nodes[i] for i in unwind_path(self.pred[s], s, t)]
+        return float(self.dist[s, t]), path
+
+    def decrease_edge(self, a, b, weight, block_rows=256):
+        """Met à jour les matrices après la baisse du poids de l'arête {a, b} (indices)"""
+        n = len(self.nodes)
+        for x, y in ((a, b), (b, a)):
+            row_y = np.array(self.dist[y])
+            # Prédécesseur de j sur le chemin i → x → y → j
+            pred_via = np.where(np.arange(n) == y, x, np.array(self.pred[y]))
+            for start in range(0, n, block_rows):
+                rows = slice(start, min(start + block_rows, n))
+                via = self.dist[rows, x][:, None] + weight + row_y[None, :]
+                block = self.dist[rows]
+                better = via < block
+                if better.any():
+                    block[better] = via[better]
+                    pred_block = self.pred[rows]
+                    pred_block[better] = np.broadcast_to(pred_via, via.shape)[better]
+                    self.dist[rows] = block
+                    self.pred[rows] = pred_block
+
+    def close(self):
+        self.dist = self.pred = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+
+def adjacency_from_edges(n, u, v, w):
+    """Listes d'adjacence modifiables : adj[x][y] = poids"""
+    adj = [dict() for _ in range(n)]
+    for a, b, weight in zip(u.tolist(), v.tolist(), w.tolist()):
+        adj[a][b] = weight
+        adj[b][a] = weight
+    return adj
+
+
+class DynamicShortestPathTree:
+    """Arbre des plus courts chemins depuis source, réparé incrémentalement quand un poids change.
+
+    Une baisse propage les nouvelles distances à partir des extrémités de l'arête ; une hausse
+    sur une arête de l'arbre ne recalcule que le sous-arbre qui en dépend (à la Ramalingam–Reps).
+    """
+
+    def __init__(self, adj, source):
+        self.adj = adj
+        self.source = source
+        n = len(adj)
+        self.dist = [float('inf')] * n
+        self.pred = [-1] * n
+        self.children = [set() for _ in range(n)]
+        self.dist[source] = 0
+        self._propagate([(0, source)])
+
+    def _set_parent(self, v, parent):
+        if self.pred[v] != -1:
+            self.children[self.pred[v]].discard(v)
+        self.pred[v] = parent
+        if parent != -1:
+            self.children[parent].add(v)
+
+    def _propagate(self, heap):
+        """Dijkstra à partir des sommets de heap ; retourne les sommets fixés"""
+        heapq.heapify(heap)
+        settled = set()
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > self.dist[u]:
+                continue
+            settled.add(u)
+            for v, weight in self.adj[u].items():
+                alt = d + weight
+                if alt < self.dist[v]:
+                    self.dist[v] = alt
+                    self._set_parent(v, u)
+                    heapq.heappush(heap, (alt, v))
+        return settled
+
+    def update_edge(self, a, b, weight):
+        """Change le poids de l'arête {a, b} ; retourne le nombre de sommets touchés"""
+        old = self.adj[a][b]
+        self.adj[a][b] = weight
+        self.adj[b][a] = weight
+        if weight < old:
+            heap = []
+            for x, y in ((a, b), (b, a)):
+                if self.dist[x] + weight < self.dist[y]:
+                    self.dist[y] = self.dist[x] + weight
+                    self._set_parent(y, x)
+                    heap.append((self.dist[y], y))
+            return len(self._propagate(heap))
+
+        if weight == old or (self.pred[b] != a and self.pred[a] != b):
+            return 0
+
+        # Sous-arbre qui dépend de l'arête
+        root = b if self.pred[b] == a else a
+        affected = [root]
+        for v in affected:
+            affected.extend(self.children[v])
+        affected_set = set(affected)
+        for v in affected:
+            self.dist[v] = float('inf')
+        heap = []
+        for v in affected:
+            best, parent = float('inf'), -1
+            for y, w in self.adj[v].items():
+                if y not in affected_set and self.dist[y] + w < best:
+                    best, parent = self.dist[y] + w, y
+            self._set_parent(v, parent)
+            if parent != -1:
+                self.dist[v] = best
+                heap.append((best, v))
+        self._propagate(heap)
+        return len(affected)
+
+    def path_to(self, target):
+        if self.dist[target] == float('inf'):
+            return None
+        return unwind_path(self.pred, self.source, target)
+
+
+def yen_k_shortest_paths(adj, source, target, k):
+    """Les k plus courts chemins élémentaires de source à target (algorithme de Yen).
+
+    Un arbre des plus courts chemins vers target, calculé une seule fois, sert d'heuristique A*
+    pour les recherches de déviation ; quand la branche de l'arbre depuis le nœud de déviation
+    évite les arêtes et sommets interdits, elle est réutilisée telle quelle. Les recherches de
+    déviation sont aussi mises en cache par (nœud, arêtes interdites, sommets interdits).
+    Retourne une liste de (distance, chemin en indices).
+    """
+    to_target = DynamicShortestPathTree(adj, target)
+    h = to_target.dist
+    if h[source] == float('inf'):
+        return []
+
+    def tree_path(node):
+        path = [node]
+        while path[-1] != target:
+            path.append(to_target.pred[path[-1]])
+        return path
+
+    spur_cache = {}
+
+    def spur_search(spur, banned_edges, banned_nodes):
+        key = (spur, banned_edges, banned_nodes)
+        if key in spur_cache:
+            return spur_cache[key]
+        path = tree_path(spur)
+        if not any(x in banned_nodes for x in path) and \
+                not any((a, b) in banned_edges for a, b in zip(path[:-1], path[1:])):
+            result = (h[spur], path)
+        else:
+            # A* guidé par les distances vers target
+            dist = {spur: 0}
+            pred = {}
+            heap = [(h[spur], spur)]
+            result = None
+            while heap:
+                f, u = heapq.heappop(heap)
+                if u == target:
+                    result = (dist[u], unwind_path(pred, spur, target))
+                    break
+                if f > dist[u] + h[u]:
+                    continue
+                for v, weight in adj[u].items():
+                    if v in banned_nodes or (u, v) in banned_edges or h[v] == float('inf'):
+                        continue
+                    alt = dist[u] + weight
+                    if alt < dist.get(v, float('inf')):
+                        dist[v] = alt
+                        pred[v] = u
+                        heapq.heappush(heap, (alt + h[v], v))
+        spur_cache[key] = result
+        return result
+
+    paths = [(h[source], tree_path(source))]
+    candidates = []
+    seen = {tuple(paths[0][1])}
+    while len(paths) < k:
+        _, last = paths[-1]
+        root_cost = 0
+        for i in range(len(last) - 1):
+            spur = last[i]
+            root = last[:i + 1]
+            banned_edges = set()
+            for _, path in paths:
+                if path[:i + 1] == root:
+                    banned_edges.add((path[i], path[i + 1]))
+                    banned_edges.add((path[i + 1], path[i]))
+            found = spur_search(spur, frozenset(banned_edges), frozenset(root[:-1]))
+            if found is not None:
+                spur_cost, spur_path = found
+                candidate = root[:-1] + spur_path
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (root_cost + spur_cost, candidate))
+            # Coût du préfixe mis à jour au fil de l'eau
+            root_cost += adj[last[i]][last[i + 1]]
+        if not candidates:
+            break
+        paths.append(heapq.heappop(candidates))
+    return paths
+
+
+def pair_from_index(k):
+    """Convertit des indices linéaires k en paires (i, j), i < j, du triangle des arêtes possibles"""
+    j = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    # Corrige les erreurs d'arrondi de la racine carrée
+    j -= (j * (j - 1) // 2) > k
+    j += ((j + 1) * j // 2) <= k
+    i = k - j * (j - 1) // 2
+    return i, j
+
+
+def generate_random_graph(n_vertices, avg_degree=None, seed=None, max_weight=100):
+    """Graphe aléatoire non orienté de degré moyen avg_degree (complet si None).
+
+    Les arêtes et les poids sont tirés en bloc avec un générateur NumPy.
+    Retourne (sommets, (u, v, w)) où u, v, w sont les tableaux des arêtes.
+    """
+    rng = np.random.default_rng(seed)
+    max_edges = n_vertices * (n_vertices - 1) // 2
+    if avg_degree is None:
+        n_edges = max_edges
+    else:
+        n_edges = min(max_edges, int(round(n_vertices * avg_degree / 2)))
+
+    if n_edges == max_edges:
+        u, v = np.triu_indices(n_vertices, k=1)
+    else:
+        u, v = pair_from_index(rng.choice(max_edges, n_edges, replace=False))
+    w = rng.integers(1, max_weight + 1, size=len(u))
+
+    sommets = [f"X{i}" for i in range(n_vertices)]
+    return sommets, (u, v, w)
+
+
+def build_graph(sommets, edges):
+    """Construit le nx.Graph correspondant (insertion en bloc), pour l'affichage"""
+    u, v, w = edges
+    labels = np.array(sommets, dtype=object)
+    G = nx.Graph()
+    G.add_nodes_from(sommets)
+    G.add_weighted_edges_from(zip(labels[u], labels[v], w.tolist()))
+    return G
+
+
+def undirected_csr(n, u, v, w):
+    return edges_to_csr(n, np.concatenate([u, v]), np.concatenate([v, u]),
+                        np.concatenate([w, w]).astype(float))
+
+
+def edges_to_matrix(n, u, v, w):
+    W = np.full((n, n), np.inf)
+    W[u, v] = w
+    W[v, u] = w
+    return W
+
+
 class DijkstraApp:
     def __init__(self, parent):
         self.parent = parent
@@ -27,12 +754,27 @@ class DijkstraApp:
             'edge': '#E0E0E0',          # Gris clair pour les arêtes
             'path': '#C67F89'           # Rose pour le chemin
         }
+        # Couleurs des chemins alternatifs (k plus courts chemins)
+        self.layer_colors = ['#C67F89', '#734158', '#7EA0B7', '#E5B25D', '#6BBF8A',
+                             '#9B72CF', '#E07A5F', '#3D5A80', '#81B29A', '#F2CC8F']
 
         self.top.configure(bg=self.colors['bg'])
 
         # Variables globales
         self.G = None
         self.sommets = []
+        self.index = {}
+        self.edges = None
+        self.W = None
+        self.csr = None
+        self.pos = None
+        self.apsp_cache = None
+        self.apsp_future = None
+        self.ch = None
+        self.ch_future = None
+        self.sp_tree = None
+        self.adj = None
+        self.executor = ThreadPoolExecutor(max_workers=1)
 
         # Container principal
         self.main_container = tk.Frame(self.top, bg=self.colors['bg'], padx=40, pady=30)
@@ -47,6 +789,9 @@ class DijkstraApp:
         
     def return_home(self):
         """Close the Toplevel and re-show the main window"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.apsp_cache is not None:
+            self.apsp_cache.close()
         self.top.destroy()
         self.parent.deiconify()
 
@@ -93,9 +838,59 @@ class DijkstraApp:
                                         fg=self.colors['secondary'],
                                         insertbackground=self.colors['primary'],
                                         relief="flat",
-                                        width=40)
+                                        width=10)
         self.vertices_entry.pack(side="left", padx=10)
 
+        tk.Label(vertex_frame,
+                 text="Average degree",
+                 font=("Helvetica Neue", 12),
+                 bg=self.colors['bg'],
+                 fg=self.colors['secondary']).pack(side="left", padx=(10, 10))
+
+        self.degree_entry = tk.Entry(vertex_frame,
+                                     font=("Helvetica Neue", 14),
+                                     bd=0,
+                                     bg=self.colors['accent'],
+                                     fg=self.colors['secondary'],
+                                     insertbackground=self.colors['primary'],
+                                     relief="flat",
+                                     width=6)
+        self.degree_entry.pack(side="left", padx=10)
+
+        tk.Label(vertex_frame,
+                 text="Seed",
+                 font=("Helvetica Neue", 12),
+                 bg=self.colors['bg'],
+                 fg=self.colors['secondary']).pack(side="left", padx=(10, 10))
+
+        self.seed_entry = tk.Entry(vertex_frame,
+                                   font=("Helvetica Neue", 14),
+                                   bd=0,
+                                   bg=self.colors['accent'],
+                                   fg=self.colors['secondary'],
+                                   insertbackground=self.colors['primary'],
+                                   relief="flat",
+                                   width=6)
+        self.seed_entry.pack(side="left", padx=10)
+
+        self.precompute_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(vertex_frame,
+                       text="Precompute all pairs",
+                       variable=self.precompute_var,
+                       font=("Helvetica Neue", 12),
+                       bg=self.colors['bg'],
+                       fg=self.colors['secondary'],
+                       activebackground=self.colors['bg']).pack(side="left", padx=10)
+
+        self.contraction_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(vertex_frame,
+                       text="Contraction hierarchy",
+                       variable=self.contraction_var,
+                       font=("Helvetica Neue", 12),
+                       bg=self.colors['bg'],
+                       fg=self.colors['secondary'],
+                       activebackground=self.colors['bg']).pack(side="left", padx=10)
+
         self.generate_button = tk.Button(vertex_frame,
                                           text="Generate Graph",
                                           command=self.generate_graph,
@@ -165,6 +960,89 @@ class DijkstraApp:
                                            cursor="hand2")
         self.calculate_button.pack(side="right", padx=10)
 
+        self.k_paths_button = tk.Button(path_frame,
+                                        text="k Shortest Paths",
+                                        command=self.execute_k_shortest_paths,
+                                        font=("Helvetica Neue", 12, "bold"),
+                                        bg=self.colors['rose'],
+                                        fg="white",
+                                        activebackground=self.colors['secondary'],
+                                        activeforeground="white",
+                                        relief="flat",
+                                        bd=0,
+                                        padx=20,
+                                        pady=10,
+                                        cursor="hand2")
+        self.k_paths_button.pack(side="right", padx=10)
+
+        self.k_entry = tk.Entry(path_frame,
+                                font=("Helvetica Neue", 14),
+                                bd=0,
+                                bg=self.colors['accent'],
+                                fg=self.colors['secondary'],
+                                insertbackground=self.colors['primary'],
+                                relief="flat",
+                                width=4)
+        self.k_entry.insert(0, "3")
+        self.k_entry.pack(side="right", padx=10)
+
+        tk.Label(path_frame,
+                 text="k:",
+                 font=("Helvetica Neue", 12),
+                 bg=self.colors['bg'],
+                 fg=self.colors['secondary']).pack(side="right")
+
+        # Troisième ligne : modification du poids d'une arête
+        edit_frame = tk.Frame(input_frame, bg=self.colors['bg'])
+        edit_frame.pack(fill="x", pady=10)
+
+        tk.Label(edit_frame,
+                 text="Edge (e.g., X1-X4):",
+                 font=("Helvetica Neue", 12),
+                 bg=self.colors['bg'],
+                 fg=self.colors['secondary']).pack(side="left", padx=(0, 10))
+
+        self.edge_entry = tk.Entry(edit_frame,
+                                   font=("Helvetica Neue", 14),
+                                   bd=0,
+                                   bg=self.colors['accent'],
+                                   fg=self.colors['secondary'],
+                                   insertbackground=self.colors['primary'],
+                                   relief="flat",
+                                   width=12)
+        self.edge_entry.pack(side="left", padx=10)
+
+        tk.Label(edit_frame,
+                 text="New weight:",
+                 font=("Helvetica Neue", 12),
+                 bg=self.colors['bg'],
+                 fg=self.colors['secondary']).pack(side="left", padx=(20, 10))
+
+        self.weight_entry = tk.Entry(edit_frame,
+                                     font=("Helvetica Neue", 14),
+                                     bd=0,
+                                     bg=self.colors['accent'],
+                                     fg=self.colors['secondary'],
+                                     insertbackground=self.colors['primary'],
+                                     relief="flat",
+                                     width=8)
+        self.weight_entry.pack(side="left", padx=10)
+
+        self.update_button = tk.Button(edit_frame,
+                                       text="Update Weight",
+                                       command=self.update_edge_weight,
+                                       font=("Helvetica Neue", 12, "bold"),
+                                       bg=self.colors['rose'],
+                                       fg="white",
+                                       activebackground=self.colors['secondary'],
+                                       activeforeground="white",
+                                       relief="flat",
+                                       bd=0,
+                                       padx=20,
+                                       pady=10,
+                                       cursor="hand2")
+        self.update_button.pack(side="right", padx=10)
+
     def create_result_section(self):
         self.result_var = StringVar()
         self.result_var.set("Ready to generate graph")
@@ -211,28 +1089,177 @@ class DijkstraApp:
             if n_vertices < 2:
                 raise ValueError("Please enter at least 2 vertices")
 
-            self.G = nx.Graph()
-            self.sommets = [f"X{i}" for i in range(n_vertices)]
+            # Degré moyen vide : graphe complet
+            degree_text = self.degree_entry.get().strip()
+            avg_degree = float(degree_text) if degree_text else None
+            if avg_degree is not None and avg_degree <= 0:
+                raise ValueError("Average degree must be positive")
+            seed_text = self.seed_entry.get().strip()
+            seed = int(seed_text) if seed_text else None
 
-            # Créer les nœuds et les arêtes
-            for sommet in self.sommets:
-                self.G.add_node(sommet)
-            for i in range(n_vertices):
-                for j in range(i + 1, n_vertices):
-                    poids = random.randint(1, 100)
-                    self.G.add_edge(self.sommets[i], self.sommets[j], weight=poids)
+            self.sommets, self.edges = generate_random_graph(n_vertices, avg_degree, seed)
+            self.index = {sommet: i for i, sommet in enumerate(self.sommets)}
+            self.adj = None
+            self.sp_tree = None
 
             # Mettre à jour les combobox
             self.source_combo['values'] = self.sommets
             self.target_combo['values'] = self.sommets
 
+            # Matrice des poids pour le moteur dense
+            u, v, w = self.edges
+            if len(u) >= DENSE_THRESHOLD * n_vertices * (n_vertices - 1) / 2:
+                self.W = edges_to_matrix(n_vertices, u, v, w)
+                self.csr = None
+            else:
+                self.W = None
+                self.csr = undirected_csr(n_vertices, u, v, w)
+
+            # Le nx.Graph n'est construit que pour l'affichage des petits graphes
+            if n_vertices <= MAX_DRAW_VERTICES:
+                self.G = build_graph(self.sommets, self.edges)
+                self.pos = nx.spring_layout(self.G)
+            else:
+                self.G = None
+                self.pos = None
             self.draw_graph()
             self.result_var.set("Graph generated successfully. Select source and target vertices.")
 
+            self.start_precompute()
+            self.start_contraction()
+
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+
+    def start_precompute(self):
+        """Lance le calcul toutes paires en arrière-plan pour le graphe courant"""
+        if self.apsp_cache is not None:
+            self.apsp_cache.close()
+        self.apsp_cache = None
+        if self.apsp_future is not None:
+            self.apsp_future.cancel()
+        self.apsp_future = None
+        if not self.precompute_var.get():
+            return
+
+        cache = ShortestPathCache(self.edges, self.sommets, self.W, self.csr)
+        self.apsp_future = self.executor.submit(cache.compute)
+        self.result_var.set("Graph generated successfully. Precomputing all-pairs shortest paths...")
+        self.top.after(100, self.poll_precompute, self.apsp_future)
+
+    def poll_precompute(self, future):
+        if future is not self.apsp_future:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_precompute, future)
+            return
+        try:
+            cache = future.result()
+        except Exception as e:
+            self.result_var.set(f"Error during precomputation: {str(e)}")
+            return
+        if cache.key is self.edges:
+            self.apsp_cache = cache
+            self.result_var.set("All-pairs shortest paths ready. Select source and target vertices.")
+
+    def start_contraction(self):
+        """Construit en arrière-plan la hiérarchie de contraction des graphes creux"""
+        if self.ch_future is not None:
+            self.ch_future.cancel()
+        self.ch = None
+        self.ch_future = None
+        if not self.contraction_var.get() or self.csr is None:
+            return
+
+        self.ch_future = self.executor.submit(build_contraction_hierarchy, self.csr)
+        self.top.after(100, self.poll_contraction, self.ch_future, self.edges)
+
+    def poll_contraction(self, future, edges):
+        if future is not self.ch_future:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_contraction, future, edges)
+            return
+        try:
+            ch = future.result()
+        except Exception as e:
+            self.result_var.set(f"Error during preprocessing: {str(e)}")
+            return
+        if edges is self.edges:
+            self.ch = ch
+            self.result_var.set(
+                f"Contraction hierarchy ready: preprocessing {ch.preprocessing_time:.2f}s, "
+                f"{ch.shortcut_count} shortcuts, ~{ch.memory_bytes / 1e6:.1f} MB, "
+                f"average query x{ch.dijkstra_query_time / ch.query_time:.1f} faster than Dijkstra")
+
+    def update_edge_weight(self):
+        """Change le poids d'une arête en réparant l'arbre courant et les caches au lieu de tout recalculer"""
+        try:
+            if self.edges is None:
+                raise ValueError("Please generate a graph first")
+            try:
+                a_label, b_label = [part.strip() for part in self.edge_entry.get().split('-')]
+                weight = int(self.weight_entry.get())
+            except ValueError:
+                raise ValueError("Enter an edge as X1-X4 and a non-negative integer weight")
+            if weight < 0:
+                raise ValueError("Weights must be non-negative")
+            if a_label not in self.index or b_label not in self.index:
+                raise ValueError(f"Unknown vertex in {a_label}-{b_label}")
+            a, b = self.index[a_label], self.index[b_label]
+
+            u, v, w = self.edges
+            position = np.flatnonzero(((u == a) & (v == b)) | ((u == b) & (v == a)))
+            if len(position) == 0:
+                raise ValueError(f"There is no edge {a_label}-{b_label}")
+            old = int(w[position[0]])
         except ValueError as e:
             self.result_var.set(f"Error: {str(e)}")
+            return
 
-    def execute_dijkstra(self):
+        # Arbre complet de la source sélectionnée, construit avant la modification puis réparé
+        source = self.source_combo.get()
+        if source and (self.sp_tree is None or self.sommets[self.sp_tree.source] != source):
+            if self.adj is None:
+                self.adj = adjacency_from_edges(len(self.sommets), *self.edges)
+            self.sp_tree = DynamicShortestPathTree(self.adj, self.index[source])
+        w[position[0]] = weight
+
+        # Représentations du graphe
+        if self.W is not None:
+            self.W[a, b] = self.W[b, a] = weight
+        else:
+            indptr, indices, weights = self.csr
+            for x, y in ((a, b), (b, a)):
+                row = np.arange(indptr[x], indptr[x + 1])
+                weights[row[indices[row] == y]] = weight
+        if self.G is not None:
+            self.G[a_label][b_label]['weight'] = weight
+
+        # Caches : une baisse se répercute sur les matrices toutes paires, une hausse les invalide
+        if self.apsp_cache is not None and weight < old:
+            self.apsp_cache.decrease_edge(a, b, weight)
+        elif weight != old:
+            self.start_precompute()
+        if weight != old:
+            self.start_contraction()
+
+        touched = 0
+        if self.sp_tree is not None:
+            touched = self.sp_tree.update_edge(a, b, weight)
+        elif self.adj is not None:
+            self.adj[a][b] = self.adj[b][a] = weight
+
+        message = f"Edge {a_label}-{b_label}: {old} → {weight}"
+        if self.sp_tree is not None:
+            message += f" │ shortest-path tree repaired, {touched} vertices touched"
+        self.result_var.set(message)
+        if self.source_combo.get() and self.target_combo.get():
+            self.execute_dijkstra(message)
+        elif self.G is not None:
+            self.draw_graph()
+
+    def execute_dijkstra(self, header=None):
         source = self.source_combo.get()
         target = self.target_combo.get()
 
@@ -241,25 +1268,94 @@ class DijkstraApp:
             return
 
         try:
-            distance, path = nx.single_source_dijkstra(self.G, source, target, weight='weight')
+            details = ""
+            if self.apsp_cache is not None and self.apsp_cache.key is self.edges:
+                distance, path = self.apsp_cache.query(source, target)
+            elif self.sp_tree is not None and self.sommets[self.sp_tree.source] == source:
+                # Arbre conservé pour cette source (éventuellement réparé après une modification)
+                indices = self.sp_tree.path_to(self.index[target])
+                if indices is None:
+                    raise nx.NetworkXNoPath(f"No path to {target}.")
+                distance, path = self.sp_tree.dist[self.index[target]], [self.sommets[i] for i in indices]
+            elif self.ch is not None:
+                start = time.perf_counter()
+                distance, path = ch_single_source_dijkstra(self.sommets, self.ch, self.csr, source, target,
+                                                           self.index)
+                elapsed = time.perf_counter() - start
+                details = (f"\nCH query: {elapsed * 1000:.2f} ms "
+                           f"(x{self.ch.dijkstra_query_time / elapsed:.1f} vs Dijkstra)")
+            elif self.W is not None:
+                distance, path = dense_single_source_dijkstra(self.sommets, self.W, source, target, self.index)
+            elif integer_weight_bound(self.csr[2]) is not None:
+                distance, path = csr_single_source_dijkstra(self.sommets, self.csr, source, target,
+                                                            engine=bucket_dijkstra, index=self.index)
+            else:
+                distance, path = csr_single_source_dijkstra(self.sommets, self.csr, source, target,
+                                                            index=self.index)
+            distance = format_distance(distance)
             path_edges = list(zip(path[:-1], path[1:]))
             self.draw_graph(path_edges)
 
             path_str = " → ".join(path)
-            self.result_var.set(f"Shortest path: {path_str}\nTotal distance: {distance} units")
+            result = f"Shortest path: {path_str}\nTotal distance: {distance} units{details}"
+            self.result_var.set(f"{header}\n{result}" if header else result)
 
         except nx.NetworkXNoPath:
             self.result_var.set("No path exists between the selected vertices")
 
-    def draw_graph(self, highlighted_path=[]):
+    def execute_k_shortest_paths(self):
+        source = self.source_combo.get()
+        target = self.target_combo.get()
+
+        if not source or not target:
+            self.result_var.set("Please select both source and target vertices")
+            return
+
+        try:
+            k = int(self.k_entry.get())
+            if k < 1:
+                raise ValueError("k must be at least 1")
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        if self.adj is None:
+            self.adj = adjacency_from_edges(len(self.sommets), *self.edges)
+        start = time.perf_counter()
+        paths = yen_k_shortest_paths(self.adj, self.index[source], self.index[target], k)
+        elapsed = time.perf_counter() - start
+        if not paths:
+            self.result_var.set("No path exists between the selected vertices")
+            self.draw_graph()
+            return
+
+        layers = []
+        lines = []
+        for rank, (distance, indices) in enumerate(paths, start=1):
+            path = [self.sommets[i] for i in indices]
+            layers.append(list(zip(path[:-1], path[1:])))
+            lines.append(f"{rank}. {format_distance(distance)} units: {' → '.join(path)}")
+        self.draw_graph(layers=layers)
+        self.result_var.set("\n".join(lines) + f"\n{len(paths)} paths found in {elapsed * 1000:.1f} ms")
+
+    def draw_graph(self, highlighted_path=[], layers=None):
         for widget in self.graph_frame.winfo_children():
             widget.destroy()
 
+        if self.G is None:
+            tk.Label(self.graph_frame,
+                     text=f"Graph too large to draw ({len(self.sommets)} vertices, "
+                          f"{len(self.edges[0])} edges)",
+                     font=("Helvetica Neue", 12),
+                     bg=self.colors['bg'],
+                     fg=self.colors['secondary']).pack(pady=20)
+            return
+
         fig = Figure(figsize=(8, 6), dpi=80, facecolor=self.colors['bg'])
         ax = fig.add_subplot(111)
         ax.set_facecolor(self.colors['bg'])
 
-        pos = nx.spring_layout(self.G)
+        pos = self.pos
 
         # Dessiner les arêtes
         nx.draw_networkx_edges(self.G, pos,
@@ -267,6 +1363,16 @@ class DijkstraApp:
                                 width=2,
                                 ax=ax)
 
+        # Chemins alternatifs : du moins bon au meilleur, pour que le plus court reste au-dessus
+        if layers:
+            for rank in reversed(range(len(layers))):
+                nx.draw_networkx_edges(self.G, pos,
+                                        edgelist=layers[rank],
+                                        edge_color=self.layer_colors[rank % len(self.layer_colors)],
+                                        width=max(2, 3 + 2 * (len(layers) - rank - 1) / len(layers) * 3),
+                                        alpha=0.85,
+                                        ax=ax)
+
         # Dessiner le chemin surligné
         if highlighted_path:
             nx.draw_networkx_edges(self.G, pos,
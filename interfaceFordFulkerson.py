@@ -1,10 +1,777 @@
 import tkinter as tk
-from tkinter import ttk, StringVar
+from tkinter import ttk, StringVar, filedialog
 import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import heapq
+import numpy as np
+import os
+import time
+from interfaceDijkstra import MAX_DRAW_VERTICES
+from interfaceBellmanFord import bellman_ford_arrays
+
+# En dessous de cette taille, les coupes de Gomory-Hu sont calculées sans pool de processus
+GOMORY_HU_PARALLEL_MIN = 200
+# Réseau non orienté des processus du pool de Gomory-Hu (voir _init_cut_worker)
+_worker_network = None
+
+
+class ResidualNetwork:
+    """Réseau résiduel compact : l'arc 2i est l'arc i du réseau, l'arc 2i + 1 son arc retour.
+
+    Les arcs sont rangés par origine (CSR : arc_start / arc_order), les capacités résiduelles
+    sont dans residual ; le flot de l'arc i vaut capacity[i] - residual[2i]. cost[i] est le
+    coût unitaire de l'arc i (nul si le réseau n'a pas de coûts).
+    """
+
+    def __init__(self, n, tails, heads, capacities, costs=None):
+        self.n = n
+        self.tails = np.asarray(tails, dtype=np.int32)
+        self.heads = np.asarray(heads, dtype=np.int32)
+        self.capacity = np.array(capacities, dtype=np.int64)
+        if costs is None:
+            self.cost = np.zeros(len(self.tails), dtype=np.int64)
+        else:
+            self.cost = np.array(costs, dtype=np.int64)
+        m = len(self.tails)
+        self.arc_head = np.empty(2 * m, dtype=np.int32)
+        self.arc_head[0::2] = self.heads
+        self.arc_head[1::2] = self.tails
+        arc_tail = np.empty(2 * m, dtype=np.int32)
+        arc_tail[0::2] = self.tails
+        arc_tail[1::2] = self.heads
+        self.arc_order = np.argsort(arc_tail, kind='stable').astype(np.int32)
+        self.arc_start = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(arc_tail, minlength=n), out=self.arc_start[1:])
+        self.residual = np.empty(2 * m, dtype=np.int64)
+        self._start = None
+        self.reset()
+
+    def reset(self):
+        """Flot nul"""
+        self.residual[0::2] = self.capacity
+        self.residual[1::2] = 0
+
+    def flows(self):
+        return self.capacity - self.residual[0::2]
+
+    def structure(self):
+        """Structure (arc_start, arc_order, arc_head) pour les boucles Python : arc_start en liste,
+        calculée une seule fois, les tableaux d'arcs lus sans copie par memoryview"""
+        if self._start is None:
+            self._start = self.arc_start.tolist()
+        return self._start, memoryview(self.arc_order), memoryview(self.arc_head)
+
+    def views(self):
+        """Structure et capacités résiduelles pour les moteurs ; residual est modifié en place"""
+        return self.structure() + (memoryview(self.residual),)
+
+
+def edmonds_karp(network, s, t):
+    """Chemins augmentants les plus courts (BFS avec deque) ; retourne (flot ajouté, statistiques)"""
+    start, order, head, res = network.views()
+    n = network.n
+    flow = augmentations = 0
+    while True:
+        parent_arc = [-1] * n
+        parent_arc[s] = -2
+        queue = deque([s])
+        while queue and parent_arc[t] == -1:
+            u = queue.popleft()
+            for i in range(start[u], start[u + 1]):
+                a = order[i]
+                v = head[a]
+                if res[a] > 0 and parent_arc[v] == -1:
+                    parent_arc[v] = a
+                    queue.append(v)
+        if parent_arc[t] == -1:
+            break
+        path_flow = float('inf')
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            path_flow = min(path_flow, res[a])
+            v = head[a ^ 1]
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            res[a] -= path_flow
+            res[a ^ 1] += path_flow
+            v = head[a ^ 1]
+        flow += path_flow
+        augmentations += 1
+    return flow, {'augmentations': augmentations}
+
+
+def dinic(network, s, t):
+    """Dinic : graphe de niveaux par BFS puis flot bloquant par DFS itératif avec arc courant"""
+    start, order, head, res = network.views()
+    n = network.n
+    flow = phases = augmentations = 0
+    while True:
+        level = [-1] * n
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            if level[t] >= 0 and level[u] >= level[t]:
+                # Les niveaux au-delà de celui de t sont inutiles au flot bloquant
+                break
+            for i in range(start[u], start[u + 1]):
+                a = order[i]
+                if res[a] > 0 and level[head[a]] < 0:
+                    level[head[a]] = level[u] + 1
+                    queue.append(head[a])
+        if level[t] < 0:
+            break
+        phases += 1
+
+        current = start[:-1]
+        while True:
+            path = []
+            u = s
+            while u != t:
+                i = current[u]
+                end = start[u + 1]
+                while i < end:
+                    a = order[i]
+                    if res[a] > 0 and level[head[a]] == level[u] + 1:
+                        break
+                    i += 1
+                current[u] = i
+                if i < end:
+                    path.append(order[i])
+                    u = head[order[i]]
+                elif u == s:
+                    break
+                else:
+                    # Impasse : on retire u du graphe de niveaux et on recule
+                    level[u] = -1
+                    a = path.pop()
+                    u = head[a ^ 1]
+                    current[u] += 1
+            if u != t:
+                break
+            path_flow = min(res[a] for a in path)
+            for a in path:
+                res[a] -= path_flow
+                res[a ^ 1] += path_flow
+            flow += path_flow
+            augmentations += 1
+    return flow, {'phases': phases, 'augmentations': augmentations}
+
+
+def push_relabel(network, s, t):
+    """Push-relabel, sommet actif le plus haut d'abord, avec heuristique du trou (gap).
+
+    Les sommets qui ne peuvent plus atteindre t remontent au-dessus de n et rendent leur
+    excédent à la source : le résultat est un flot valide, pas seulement un préflot.
+    """
+    start, order, head, res = network.views()
+    n = network.n
+    max_height = 2 * n
+
+    # Hauteurs initiales : distance à t dans le graphe résiduel (BFS inverse)
+    height = [n] * n
+    height[t] = 0
+    queue = deque([t])
+    while queue:
+        v = queue.popleft()
+        for i in range(start[v], start[v + 1]):
+            a = order[i]
+            u = head[a]
+            if res[a ^ 1] > 0 and height[u] == n and u != t:
+                height[u] = height[v] + 1
+                queue.append(u)
+    height[s] = n
+    count = [0] * (max_height + 1)
+    for h in height:
+        count[h] += 1
+
+    excess = [0] * n
+    buckets = [[] for _ in range(max_height + 1)]
+    active = [False] * n
+    highest = 0
+    for i in range(start[s], start[s + 1]):
+        a = order[i]
+        delta = res[a]
+        if delta > 0:
+            v = head[a]
+            res[a] -= delta
+            res[a ^ 1] += delta
+            excess[v] += delta
+            excess[s] -= delta
+            if v != t and not active[v]:
+                active[v] = True
+                buckets[height[v]].append(v)
+                highest = max(highest, height[v])
+
+    current = start[:-1]
+    pushes = relabels = gaps = 0
+    while True:
+        while highest > 0 and not buckets[highest]:
+            highest -= 1
+        if not buckets[highest]:
+            break
+        u = buckets[highest].pop()
+        active[u] = False
+        end = start[u + 1]
+        while excess[u] > 0:
+            i = current[u]
+            if i == end:
+                # Relabel
+                old = height[u]
+                new = max_height
+                for j in range(start[u], end):
+                    a = order[j]
+                    if res[a] > 0 and height[head[a]] + 1 < new:
+                        new = height[head[a]] + 1
+                count[old] -= 1
+                height[u] = new
+                count[new] += 1
+                current[u] = start[u]
+                relabels += 1
+                if count[old] == 0 and old < n:
+                    # Trou : les sommets entre old et n ne peuvent plus atteindre t
+                    gaps += 1
+                    for v in range(n):
+                        if old < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n + 1
+                            count[n + 1] += 1
+                    if height[u] < n + 1:
+                        count[height[u]] -= 1
+                        height[u] = n + 1
+                        count[n + 1] += 1
+                continue
+            a = order[i]
+            v = head[a]
+            if res[a] > 0 and height[u] == height[v] + 1:
+                delta = min(excess[u], res[a])
+                res[a] -= delta
+                res[a ^ 1] += delta
+                excess[u] -= delta
+                excess[v] += delta
+                pushes += 1
+                if v != s and v != t and not active[v]:
+                    active[v] = True
+                    buckets[height[v]].append(v)
+                    if height[v] > highest:
+                        highest = height[v]
+            else:
+                current[u] = i + 1
+    return excess[t], {'pushes': pushes, 'relabels': relabels, 'gaps': gaps}
+
+
+def capacity_scaling(network, s, t):
+    """Augmentation par paliers : chemins (BFS) de capacité résiduelle >= delta, delta divisé par 2 à chaque phase"""
+    start, order, head, res = network.views()
+    n = network.n
+    delta = 1
+    largest = max(res) if res else 0
+    while delta * 2 <= largest:
+        delta *= 2
+    flow = phases = augmentations = 0
+    while delta >= 1 and largest > 0:
+        phases += 1
+        while True:
+            parent_arc = [-1] * n
+            parent_arc[s] = -2
+            queue = deque([s])
+            while queue and parent_arc[t] == -1:
+                u = queue.popleft()
+                for i in range(start[u], start[u + 1]):
+                    a = order[i]
+                    v = head[a]
+                    if res[a] >= delta and parent_arc[v] == -1:
+                        parent_arc[v] = a
+                        queue.append(v)
+            if parent_arc[t] == -1:
+                break
+            path_flow = float('inf')
+            v = t
+            while v != s:
+                a = parent_arc[v]
+                path_flow = min(path_flow, res[a])
+                v = head[a ^ 1]
+            v = t
+            while v != s:
+                a = parent_arc[v]
+                res[a] -= path_flow
+                res[a ^ 1] += path_flow
+                v = head[a ^ 1]
+            flow += path_flow
+            augmentations += 1
+        delta //= 2
+    return flow, {'phases': phases, 'augmentations': augmentations}
+
+
+ENGINES = {
+    "Dinic": dinic,
+    "Edmonds-Karp": edmonds_karp,
+    "Push-relabel (highest label)": push_relabel,
+    "Capacity scaling": capacity_scaling,
+}
+
+
+def min_cost_flow(network, s, t, demand=None):
+    """Flot de coût minimal par plus courts chemins successifs avec potentiels de Johnson.
+
+    Repart du flot nul et envoie demand unités de s à t (le flot maximal si demand vaut None).
+    Les potentiels rendent tous les coûts réduits positifs ou nuls : chaque augmentation est
+    un Dijkstra arrêté dès que t est atteint. Retourne (flot, coût, statistiques).
+    """
+    network.reset()
+    start, order, head, res = network.views()
+    n = network.n
+    cost = np.empty(2 * len(network.cost), dtype=np.int64)
+    cost[0::2] = network.cost
+    cost[1::2] = -network.cost
+    cost = cost.tolist()
+
+    potential = [0] * n
+    if len(network.cost) and network.cost.min() < 0:
+        # Potentiels initiaux par Bellman-Ford sur les arcs de capacité non nulle
+        usable = network.capacity > 0
+        dist, _, cycle = bellman_ford_arrays(n, network.tails[usable], network.heads[usable],
+                                             network.cost[usable].astype(float), s)
+        if cycle is not None:
+            raise ValueError("The network contains a negative-cost cycle")
+        potential = np.where(np.isfinite(dist), dist, 0).astype(np.int64).tolist()
+
+    remaining = float('inf') if demand is None else demand
+    flow = total_cost = augmentations = 0
+    inf = float('inf')
+    while remaining > 0:
+        dist = [inf] * n
+        parent_arc = [-1] * n
+        done = [False] * n
+        dist[s] = 0
+        heap = [(0, s)]
+        settled = []
+        while heap:
+            d, u = heapq.heappop(heap)
+            if done[u]:
+                continue
+            done[u] = True
+            settled.append(u)
+            if u == t:
+                break
+            pu = potential[u]
+            for i in range(start[u], start[u + 1]):
+                a = order[i]
+                if res[a] > 0:
+                    v = head[a]
+                    nd = d + cost[a] + pu - potential[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        parent_arc[v] = a
+                        heapq.heappush(heap, (nd, v))
+        if not done[t]:
+            break
+
+        # Les sommets fixés avant t gagnent dist[v] - dist[t] : les coûts réduits restent >= 0
+        dt = dist[t]
+        for v in settled:
+            potential[v] += dist[v] - dt
+
+        path_flow = remaining
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            path_flow = min(path_flow, res[a])
+            v = head[a ^ 1]
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            res[a] -= path_flow
+            res[a ^ 1] += path_flow
+            total_cost += path_flow * cost[a]
+            v = head[a ^ 1]
+        flow += path_flow
+        remaining -= path_flow
+        augmentations += 1
+    return flow, total_cost, {'augmentations': augmentations}
+
+
+def flow_value(network, t):
+    """Valeur du flot : flot entrant net dans t"""
+    flows = network.flows()
+    return int(flows[network.heads == t].sum() - flows[network.tails == t].sum())
+
+
+def augment_between(network, a, b, limit):
+    """Pousse au plus limit unités de a vers b par chemins augmentants ; retourne la quantité poussée"""
+    start, order, head, res = network.views()
+    n = network.n
+    pushed = 0
+    while pushed < limit:
+        parent_arc = [-1] * n
+        parent_arc[a] = -2
+        queue = deque([a])
+        while queue and parent_arc[b] == -1:
+            u = queue.popleft()
+            for i in range(start[u], start[u + 1]):
+                arc = order[i]
+                v = head[arc]
+                if res[arc] > 0 and parent_arc[v] == -1:
+                    parent_arc[v] = arc
+                    queue.append(v)
+        if parent_arc[b] == -1:
+            break
+        path_flow = limit - pushed
+        v = b
+        while v != a:
+            arc = parent_arc[v]
+            path_flow = min(path_flow, res[arc])
+            v = head[arc ^ 1]
+        v = b
+        while v != a:
+            arc = parent_arc[v]
+            res[arc] -= path_flow
+            res[arc ^ 1] += path_flow
+            v = head[arc ^ 1]
+        pushed += path_flow
+    return pushed
+
+
+def change_capacity(network, edge, capacity, s, t):
+    """Modifie la capacité d'un arc en gardant un flot réalisable pour un redémarrage à chaud.
+
+    Une hausse ne touche pas au flot. Une baisse sous le flot courant de u → v retire l'excédent
+    de l'arc, tente de le faire passer de u à v par un autre chemin, puis renvoie le reste de u
+    vers s et de t vers v (le flot total diminue d'autant).
+    """
+    u = int(network.tails[edge])
+    v = int(network.heads[edge])
+    flow = int(network.capacity[edge] - network.residual[2 * edge])
+    network.capacity[edge] = capacity
+    stats = {'rerouted': 0, 'returned': 0}
+    if capacity >= flow:
+        network.residual[2 * edge] = capacity - flow
+        return stats
+
+    surplus = flow - capacity
+    network.residual[2 * edge] = 0
+    network.residual[2 * edge + 1] = capacity
+    stats['rerouted'] = augment_between(network, u, v, surplus)
+    remainder = surplus - stats['rerouted']
+    if remainder > 0:
+        if u != s and u != t:
+            augment_between(network, u, s, remainder)
+        if v != s and v != t:
+            augment_between(network, t, v, remainder)
+        stats['returned'] = remainder
+    return stats
+
+
+def min_cut(network, s):
+    """Coupe minimale : sommets atteignables depuis s dans le graphe résiduel et arcs qui en sortent"""
+    start, order, head, res = network.views()
+    reachable = [False] * network.n
+    reachable[s] = True
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        for i in range(start[u], start[u + 1]):
+            a = order[i]
+            if res[a] > 0 and not reachable[head[a]]:
+                reachable[head[a]] = True
+                queue.append(head[a])
+    reachable = np.array(reachable)
+    cut_edges = np.flatnonzero(reachable[network.tails] & ~reachable[network.heads])
+    return reachable, cut_edges
+
+
+def undirected_network(n, tails, heads, capacities):
+    """Réseau non orienté : chaque arête {u, v} donne un arc dans chaque sens de même capacité"""
+    return ResidualNetwork(n,
+                           np.concatenate([tails, heads]),
+                           np.concatenate([heads, tails]),
+                           np.concatenate([capacities, capacities]))
+
+
+def undirected_min_cut(network, s, t):
+    """Coupe minimale s-t calculée à froid : (valeur, masque du côté de s)"""
+    network.reset()
+    value, _ = dinic(network, s, t)
+    reachable, _ = min_cut(network, s)
+    return value, reachable
+
+
+def _init_cut_worker(n, tails, heads, capacities):
+    """Construit une fois par processus le réseau non orienté utilisé par les coupes"""
+    global _worker_network
+    _worker_network = undirected_network(n, tails, heads, capacities)
+
+
+def _min_cut_task(pair):
+    s, t = pair
+    value, reachable = undirected_min_cut(_worker_network, s, t)
+    return s, t, value, np.packbits(reachable)
+
+
+class GomoryHuTree:
+    """Arbre de coupes de Gomory-Hu d'un réseau non orienté, par l'algorithme de Gusfield.
+
+    parent[v] et weight[v] décrivent l'arête v - parent[v] de l'arbre (racine 0). Les n - 1
+    coupes sont calculées sur le réseau d'origine par des processus ouvriers, par lots
+    spéculatifs : la coupe de s est lancée avec le parent connu au moment de l'envoi et
+    recalculée si ce parent a changé entre-temps.
+    """
+
+    def __init__(self, n, tails, heads, capacities, processes=None, batch=None):
+        self.n = n
+        self.processes = processes or os.cpu_count() or 1
+        batch = batch or 2 * self.processes
+        start = time.perf_counter()
+        parent = np.zeros(n, dtype=np.int64)
+        weight = np.zeros(n, dtype=np.int64)
+        local = undirected_network(n, tails, heads, capacities)
+        self.recomputed = 0
+
+        if self.processes == 1 or n < GOMORY_HU_PARALLEL_MIN:
+            self.processes = 1
+            for s in range(1, n):
+                value, side = undirected_min_cut(local, s, int(parent[s]))
+                self._update(parent, weight, s, int(parent[s]), value, side)
+        else:
+            with ProcessPoolExecutor(max_workers=self.processes, initializer=_init_cut_worker,
+                                     initargs=(n, tails, heads, capacities)) as pool:
+                futures = {}
+                submitted = 1
+                for s in range(1, n):
+                    while submitted < n and submitted < s + batch:
+                        futures[submitted] = pool.submit(_min_cut_task, (submitted, int(parent[submitted])))
+                        submitted += 1
+                    _, t, value, packed = futures.pop(s).result()
+                    if t == parent[s]:
+                        side = np.unpackbits(packed, count=n).astype(bool)
+                    else:
+                        # Spéculation périmée : le parent de s a changé depuis l'envoi
+                        self.recomputed += 1
+                        t = int(parent[s])
+                        value, side = undirected_min_cut(local, s, t)
+                    self._update(parent, weight, s, t, value, side)
+
+        self.parent = parent.tolist()
+        self.weight = weight.tolist()
+        depth = [0] * n
+        for v in self._preorder():
+            if v:
+                depth[v] = depth[self.parent[v]] + 1
+        self.depth = depth
+        self.build_time = time.perf_counter() - start
+
+    @staticmethod
+    def _update(parent, weight, s, t, value, side):
+        weight[s] = value
+        moved = side & (parent == t)
+        moved[s] = False
+        parent[moved] = s
+        if t != 0 and side[parent[t]]:
+            parent[s] = parent[t]
+            parent[t] = s
+            weight[s] = weight[t]
+            weight[t] = value
+
+    def _children(self):
+        children = [[] for _ in range(self.n)]
+        for v in range(1, self.n):
+            children[self.parent[v]].append(v)
+        return children
+
+    def _preorder(self, root=0, children=None):
+        children = children or self._children()
+        order = [root]
+        stack = [root]
+        while stack:
+            for w in children[stack.pop()]:
+                order.append(w)
+                stack.append(w)
+        return order
+
+    def query(self, s, t):
+        """Valeur de la coupe minimale s-t (minimum sur le chemin de l'arbre) et l'arête v - parent[v] atteinte"""
+        if s == t:
+            raise ValueError("Source and sink must be different")
+        parent, weight, depth = self.parent, self.weight, self.depth
+        best, edge = float('inf'), None
+        while s != t:
+            if depth[s] < depth[t]:
+                s, t = t, s
+            if weight[s] < best:
+                best, edge = weight[s], s
+            s = parent[s]
+        return best, edge
+
+    def cut_side(self, edge, s):
+        """Masque du côté de s quand on retire l'arête edge - parent[edge] de l'arbre"""
+        side = np.zeros(self.n, dtype=bool)
+        side[self._preorder(edge)] = True
+        return side if side[s] else ~side
+
+
+def generate_bipartite(n_left, n_right, avg_degree=3, seed=None):
+    """Graphe biparti aléatoire : tableaux (left, right) d'arêtes sans doublon"""
+    rng = np.random.default_rng(seed)
+    m = int(n_left * avg_degree)
+    left = rng.integers(0, n_left, m)
+    right = rng.integers(0, n_right, m)
+    _, first = np.unique(left * n_right + right, return_index=True)
+    return left[first].astype(np.int32), right[first].astype(np.int32)
+
+
+def load_bipartite(path):
+    """Lit un fichier texte « gauche droite » par ligne (# pour les commentaires).
+
+    Retourne (étiquettes gauches, étiquettes droites, left, right).
+    """
+    left_index, right_index = {}, {}
+    left, right = [], []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.replace(',', ' ').split()
+            if len(parts) != 2:
+                raise ValueError(f"Line {line_number}: expected 'left right'")
+            left.append(left_index.setdefault(parts[0], len(left_index)))
+            right.append(right_index.setdefault(parts[1], len(right_index)))
+    left = np.array(left, dtype=np.int64)
+    right = np.array(right, dtype=np.int64)
+    if len(left):
+        _, first = np.unique(left * len(right_index) + right, return_index=True)
+        left, right = left[first], right[first]
+    return list(left_index), list(right_index), left.astype(np.int32), right.astype(np.int32)
+
+
+def hopcroft_karp(n_left, n_right, left, right):
+    """Couplage maximum biparti de Hopcroft-Karp sur tableaux CSR.
+
+    Chaque phase construit par BFS les couches issues des sommets gauches libres, jusqu'à la
+    première couche qui touche un sommet droit libre, puis cherche par DFS itératif des chemins
+    augmentants disjoints de cette longueur. Retourne (match_left, statistiques) où
+    match_left[i] est le sommet droit couplé à i, ou -1.
+    """
+    order = np.argsort(left, kind='stable')
+    adj = right[order].tolist()
+    start = np.zeros(n_left + 1, dtype=np.int64)
+    np.cumsum(np.bincount(left, minlength=n_left), out=start[1:])
+    start = start.tolist()
+
+    match_left = [-1] * n_left
+    match_right = [-1] * n_right
+    # Couplage glouton initial
+    for x in range(n_left):
+        for i in range(start[x], start[x + 1]):
+            if match_right[adj[i]] == -1:
+                match_left[x] = adj[i]
+                match_right[adj[i]] = x
+                break
+
+    phases = augmentations = 0
+    while True:
+        free = [x for x in range(n_left) if match_left[x] == -1]
+        dist = [-1] * n_left
+        for x in free:
+            dist[x] = 0
+        queue = deque(free)
+        limit = -1
+        while queue:
+            x = queue.popleft()
+            if limit >= 0 and dist[x] > limit:
+                break
+            for i in range(start[x], start[x + 1]):
+                w = match_right[adj[i]]
+                if w == -1:
+                    if limit < 0:
+                        limit = dist[x]
+                elif dist[w] < 0:
+                    dist[w] = dist[x] + 1
+                    queue.append(w)
+        if limit < 0:
+            break
+        phases += 1
+
+        current = start[:-1]
+        for root in free:
+            stack = [root]
+            while stack:
+                x = stack[-1]
+                if current[x] == start[x + 1]:
+                    # Impasse : x ne sert plus dans cette phase
+                    dist[x] = -1
+                    stack.pop()
+                    continue
+                y = adj[current[x]]
+                current[x] += 1
+                w = match_right[y]
+                if w == -1:
+                    if dist[x] != limit:
+                        continue
+                    for x2 in stack:
+                        y2 = adj[current[x2] - 1]
+                        match_left[x2] = y2
+                        match_right[y2] = x2
+                    augmentations += 1
+                    break
+                if dist[w] == dist[x] + 1:
+                    stack.append(w)
+    return np.array(match_left, dtype=np.int64), {'phases': phases, 'augmentations': augmentations}
+
+
+def matching_network(n_left, n_right, left, right):
+    """Couplage vu comme un flot : S = 0, gauches 1..n_left, droits ensuite, T en dernier, capacités 1"""
+    n = n_left + n_right + 2
+    sink = n - 1
+    tails = np.concatenate([np.zeros(n_left, dtype=np.int64), left + 1, n_left + 1 + np.arange(n_right)])
+    heads = np.concatenate([1 + np.arange(n_left), n_left + 1 + right, np.full(n_right, sink)])
+    return ResidualNetwork(n, tails, heads, np.ones(len(tails), dtype=np.int64))
+
+
+def generate_valid_network(num_vertices, max_capacity, seed=None, max_cost=20):
+    """Réseau aléatoire en tableaux d'arcs (tails, heads, capacities, costs), sans matrice n × n"""
+    rng = np.random.default_rng(seed)
+    n = num_vertices
+    inner = np.arange(1, n - 1)
+
+    # Arcs de la source vers 1 ou 2 sommets intermédiaires
+    k = rng.integers(1, 3)
+    tails = [np.zeros(k, dtype=np.int64)]
+    heads = [rng.integers(1, n - 1, k)]
+
+    # 1 ou 2 successeurs pour chaque sommet intermédiaire, toujours vers un indice plus grand
+    repeats = rng.integers(1, 3, len(inner))
+    succ_tails = np.repeat(inner, repeats)
+    tails.append(succ_tails)
+    heads.append(succ_tails + 1 + (rng.random(len(succ_tails)) * (n - 1 - succ_tails)).astype(np.int64))
+
+    # Un prédécesseur pour les sommets intermédiaires qui n'en ont pas
+    has_pred = np.zeros(n, dtype=bool)
+    has_pred[np.concatenate(heads)] = True
+    orphans = inner[~has_pred[inner]]
+    tails.append((rng.random(len(orphans)) * orphans).astype(np.int64))
+    heads.append(orphans)
+
+    tails = np.concatenate(tails)
+    heads = np.concatenate(heads)
+    if not np.any((heads == n - 1) & (tails > 0)):
+        tails = np.append(tails, rng.integers(1, n - 1))
+        heads = np.append(heads, n - 1)
+
+    # Arcs en double : un seul est conservé, comme dans une matrice d'adjacence
+    _, first = np.unique(tails * n + heads, return_index=True)
+    tails = tails[first].astype(np.int32)
+    heads = heads[first].astype(np.int32)
+    capacities = rng.integers(1, max_capacity + 1, len(tails), dtype=np.int64)
+    costs = rng.integers(1, max_cost + 1, len(tails), dtype=np.int64)
+    return tails, heads, capacities, costs
+
 
 class FordFulkersonApp:
     def __init__(self, parent):
@@ -31,8 +798,13 @@ class FordFulkersonApp:
         
         # Variables globales
         self.G = None
-        self.graph = None
-        self.initial_graph = None
+        self.network = None
+        self.pos = None
+        self.terminals = None
+        self.bipartite = None
+        self.gomory_hu = None
+        self.gomory_hu_future = None
+        self.executor = ThreadPoolExecutor(max_workers=1)
         
         # Container principal
         self.main_container = tk.Frame(self.top, bg=self.colors['bg'], padx=20, pady=20)
@@ -50,6 +822,7 @@ class FordFulkersonApp:
 
     def return_home(self):
         """Close the Toplevel and re-show the main window"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.top.destroy()
         self.parent.deiconify()
 
@@ -148,9 +921,66 @@ class FordFulkersonApp:
                                        cursor="hand2")
         self.generate_button.pack(side="right", padx=10)
 
+        # Source et puits
+        terminal_frame = tk.Frame(input_frame, bg=self.colors['bg'])
+        terminal_frame.pack(fill="x", pady=10)
+
+        tk.Label(terminal_frame,
+                text="Source:",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(0, 10))
+
+        self.source_combo = ttk.Combobox(terminal_frame,
+                                         font=("Helvetica Neue", 12),
+                                         width=10,
+                                         state="readonly")
+        self.source_combo.pack(side="left", padx=10)
+
+        tk.Label(terminal_frame,
+                text="Sink:",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(20, 10))
+
+        self.sink_combo = ttk.Combobox(terminal_frame,
+                                       font=("Helvetica Neue", 12),
+                                       width=10,
+                                       state="readonly")
+        self.sink_combo.pack(side="left", padx=10)
+
+        self.gomory_hu_button = tk.Button(terminal_frame,
+                                          text="Min Cut Any Pair (Gomory-Hu)",
+                                          command=self.execute_gomory_hu,
+                                          font=("Helvetica Neue", 12, "bold"),
+                                          bg=self.colors['rose'],
+                                          fg="white",
+                                          activebackground=self.colors['secondary'],
+                                          activeforeground="white",
+                                          relief="flat",
+                                          bd=0,
+                                          padx=20,
+                                          pady=8,
+                                          cursor="hand2")
+        self.gomory_hu_button.pack(side="right", padx=10)
+
         # Section calcul
         calc_frame = tk.Frame(input_frame, bg=self.colors['bg'])
         calc_frame.pack(fill="x", pady=10)
+
+        tk.Label(calc_frame,
+                text="Engine",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(0, 10))
+
+        self.engine_var = StringVar(value="Dinic")
+        self.engine_combo = ttk.Combobox(calc_frame,
+                                         textvariable=self.engine_var,
+                                         values=list(ENGINES),
+                                         state="readonly",
+                                         width=28)
+        self.engine_combo.pack(side="left", padx=10)
         
         self.calculate_button = tk.Button(calc_frame,
                                         text="Calculate Maximum Flow",
@@ -167,6 +997,162 @@ class FordFulkersonApp:
                                         cursor="hand2")
         self.calculate_button.pack(side="right", padx=10)
 
+        # Flot de coût minimal
+        cost_frame = tk.Frame(input_frame, bg=self.colors['bg'])
+        cost_frame.pack(fill="x", pady=10)
+
+        tk.Label(cost_frame,
+                text="Flow value (empty = maximum):",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(0, 10))
+
+        self.demand_entry = tk.Entry(cost_frame,
+                                     font=("Helvetica Neue", 14),
+                                     bd=0,
+                                     bg=self.colors['accent'],
+                                     fg=self.colors['secondary'],
+                                     insertbackground=self.colors['primary'],
+                                     relief="flat",
+                                     width=10)
+        self.demand_entry.pack(side="left", padx=10)
+
+        self.min_cost_button = tk.Button(cost_frame,
+                                         text="Min-Cost Flow",
+                                         command=self.execute_min_cost_flow,
+                                         font=("Helvetica Neue", 12, "bold"),
+                                         bg=self.colors['rose'],
+                                         fg="white",
+                                         activebackground=self.colors['secondary'],
+                                         activeforeground="white",
+                                         relief="flat",
+                                         bd=0,
+                                         padx=20,
+                                         pady=8,
+                                         cursor="hand2")
+        self.min_cost_button.pack(side="right", padx=10)
+
+        # Modification de la capacité d'un arc, suivie d'un recalcul à chaud
+        edit_frame = tk.Frame(input_frame, bg=self.colors['bg'])
+        edit_frame.pack(fill="x", pady=10)
+
+        tk.Label(edit_frame,
+                text="Edge (e.g., S-X1):",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(0, 10))
+
+        self.edge_entry = tk.Entry(edit_frame,
+                                   font=("Helvetica Neue", 14),
+                                   bd=0,
+                                   bg=self.colors['accent'],
+                                   fg=self.colors['secondary'],
+                                   insertbackground=self.colors['primary'],
+                                   relief="flat",
+                                   width=12)
+        self.edge_entry.pack(side="left", padx=10)
+
+        tk.Label(edit_frame,
+                text="New capacity:",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(20, 10))
+
+        self.new_capacity_entry = tk.Entry(edit_frame,
+                                           font=("Helvetica Neue", 14),
+                                           bd=0,
+                                           bg=self.colors['accent'],
+                                           fg=self.colors['secondary'],
+                                           insertbackground=self.colors['primary'],
+                                           relief="flat",
+                                           width=8)
+        self.new_capacity_entry.pack(side="left", padx=10)
+
+        self.update_button = tk.Button(edit_frame,
+                                       text="Update Capacity",
+                                       command=self.update_capacity,
+                                       font=("Helvetica Neue", 12, "bold"),
+                                       bg=self.colors['rose'],
+                                       fg="white",
+                                       activebackground=self.colors['secondary'],
+                                       activeforeground="white",
+                                       relief="flat",
+                                       bd=0,
+                                       padx=20,
+                                       pady=8,
+                                       cursor="hand2")
+        self.update_button.pack(side="right", padx=10)
+
+        # Couplage biparti (Hopcroft-Karp)
+        matching_frame = tk.Frame(input_frame, bg=self.colors['bg'])
+        matching_frame.pack(fill="x", pady=10)
+
+        tk.Label(matching_frame,
+                text="Bipartite: left",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(0, 10))
+
+        self.left_entry = tk.Entry(matching_frame,
+                                   font=("Helvetica Neue", 14),
+                                   bd=0,
+                                   bg=self.colors['accent'],
+                                   fg=self.colors['secondary'],
+                                   insertbackground=self.colors['primary'],
+                                   relief="flat",
+                                   width=8)
+        self.left_entry.pack(side="left", padx=10)
+
+        tk.Label(matching_frame,
+                text="right",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(10, 10))
+
+        self.right_entry = tk.Entry(matching_frame,
+                                    font=("Helvetica Neue", 14),
+                                    bd=0,
+                                    bg=self.colors['accent'],
+                                    fg=self.colors['secondary'],
+                                    insertbackground=self.colors['primary'],
+                                    relief="flat",
+                                    width=8)
+        self.right_entry.pack(side="left", padx=10)
+
+        tk.Label(matching_frame,
+                text="avg degree",
+                font=("Helvetica Neue", 12),
+                bg=self.colors['bg'],
+                fg=self.colors['secondary']).pack(side="left", padx=(10, 10))
+
+        self.bipartite_degree_entry = tk.Entry(matching_frame,
+                                               font=("Helvetica Neue", 14),
+                                               bd=0,
+                                               bg=self.colors['accent'],
+                                               fg=self.colors['secondary'],
+                                               insertbackground=self.colors['primary'],
+                                               relief="flat",
+                                               width=6)
+        self.bipartite_degree_entry.insert(0, "3")
+        self.bipartite_degree_entry.pack(side="left", padx=10)
+
+        for text, command in (("Maximum Matching", self.execute_matching),
+                              ("Load Bipartite...", self.load_bipartite_graph),
+                              ("Generate Bipartite", self.generate_bipartite_graph)):
+            tk.Button(matching_frame,
+                      text=text,
+                      command=command,
+                      font=("Helvetica Neue", 12, "bold"),
+                      bg=self.colors['rose'],
+                      fg="white",
+                      activebackground=self.colors['secondary'],
+                      activeforeground="white",
+                      relief="flat",
+                      bd=0,
+                      padx=20,
+                      pady=8,
+                      cursor="hand2").pack(side="right", padx=10)
+
     def create_result_section(self):
         self.result_var = StringVar()
         self.result_var.set("Ready to generate graph")
@@ -187,30 +1173,6 @@ class FordFulkersonApp:
                                   bd=1)
         self.graph_frame.pack(fill="both", expand=True)
 
-    def generate_valid_graph(self, num_vertices, max_capacity):
-        graph = [[0] * num_vertices for _ in range(num_vertices)]
-        for _ in range(random.randint(1, 2)):
-            intermediate = random.randint(1, num_vertices - 2)
-            graph[0][intermediate] = random.randint(1, max_capacity)
-
-        for i in range(1, num_vertices - 1):
-            if not any(graph[u][i] > 0 for u in range(0, i)):
-                predecessor = random.randint(0, i - 1)
-                graph[predecessor][i] = random.randint(1, max_capacity)
-
-            num_edges = random.randint(1, 2)
-            possible_targets = [v for v in range(i + 1, num_vertices)]
-            for _ in range(num_edges):
-                if possible_targets:
-                    successor = random.choice(possible_targets)
-                    graph[i][successor] = random.randint(1, max_capacity)
-
-        if not any(graph[i][num_vertices - 1] > 0 for i in range(1, num_vertices - 1)):
-            forced_task = random.randint(1, num_vertices - 2)
-            graph[forced_task][num_vertices - 1] = random.randint(1, max_capacity)
-
-        return graph
-
     def generate_graph(self):
         try:
             num_vertices = int(self.vertices_entry.get())
@@ -218,9 +1180,27 @@ class FordFulkersonApp:
             
             if num_vertices < 3:
                 raise ValueError("Please enter at least 3 vertices")
+            if max_capacity < 1:
+                raise ValueError("Maximum capacity must be at least 1")
             
-            self.graph = self.generate_valid_graph(num_vertices, max_capacity)
-            self.initial_graph = [row[:] for row in self.graph]
+            tails, heads, capacities, costs = generate_valid_network(num_vertices, max_capacity)
+            self.network = ResidualNetwork(num_vertices, tails, heads, capacities, costs)
+            self.terminals = None
+            self.reset_gomory_hu()
+            labels = [self.vertex_label(i) for i in range(num_vertices)]
+            self.source_combo['values'] = labels
+            self.sink_combo['values'] = labels
+            self.source_combo.set('S')
+            self.sink_combo.set('T')
+
+            if num_vertices <= MAX_DRAW_VERTICES:
+                self.G = nx.DiGraph()
+                self.G.add_nodes_from(range(num_vertices))
+                self.G.add_edges_from(zip(tails.tolist(), heads.tolist()))
+                self.pos = nx.spring_layout(self.G, k=1, iterations=50)
+            else:
+                self.G = None
+                self.pos = None
             
             self.draw_graph()
             self.result_var.set("Graph generated successfully. Click 'Calculate Maximum Flow' to find the maximum flow.")
@@ -228,78 +1208,330 @@ class FordFulkersonApp:
         except ValueError as e:
             self.result_var.set(f"Error: {str(e)}")
 
-    def BFS(self, s, t, parent):
-        ROW = len(self.graph)
-        visited = [False] * ROW
-        queue = [s]
-        visited[s] = True
+    def vertex_label(self, i):
+        if i == 0:
+            return 'S'
+        if i == self.network.n - 1:
+            return 'T'
+        return f'X{i}'
 
-        while queue:
-            u = queue.pop(0)
-            for ind, val in enumerate(self.graph[u]):
-                if not visited[ind] and val > 0:
-                    queue.append(ind)
-                    visited[ind] = True
-                    parent[ind] = u
-                    if ind == t:
-                        return True
-        return False
-
-    def execute_ford_fulkerson(self):
+    def vertex_index(self, label):
+        n = self.network.n
+        if label == 'S':
+            return 0
+        if label == 'T':
+            return n - 1
+        if label.startswith('X') and label[1:].isdigit() and 0 < int(label[1:]) < n - 1:
+            return int(label[1:])
+        raise ValueError(f"Unknown vertex {label}")
+
+    def selected_terminals(self):
+        s = self.vertex_index(self.source_combo.get())
+        t = self.vertex_index(self.sink_combo.get())
+        if s == t:
+            raise ValueError("Source and sink must be different")
+        return s, t
+
+    def execute_ford_fulkerson(self, header=None):
+        """Calcule le flot maximal en repartant du flot courant (flot nul juste après la génération)"""
         try:
-            source = 0
-            sink = len(self.graph) - 1
-            parent = [-1] * len(self.graph)
-            max_flow = 0
-            flows = [[0] * len(self.graph) for _ in range(len(self.graph))]
-
-            while self.BFS(source, sink, parent):
-                path_flow = float("Inf")
-                s = sink
-                while s != source:
-                    path_flow = min(path_flow, self.graph[parent[s]][s])
-                    s = parent[s]
-
-                max_flow += path_flow
-
-                v = sink
-                while v != source:
-                    u = parent[v]
-                    self.graph[u][v] -= path_flow
-                    flows[u][v] += path_flow
-                    v = parent[v]
-
-            self.draw_graph(flows=flows)
-            self.result_var.set(f"Maximum flow: {max_flow}")
+            if self.network is None:
+                raise ValueError("Please generate a graph first")
+            network = self.network
+            s, t = self.selected_terminals()
+            if self.terminals != (s, t):
+                # Nouveau couple source/puits : le flot courant ne sert plus de point de départ
+                network.reset()
+                self.terminals = (s, t)
+
+            engine = self.engine_var.get()
+            start = time.perf_counter()
+            added, stats = ENGINES[engine](network, s, t)
+            elapsed = (time.perf_counter() - start) * 1000
+            max_flow = flow_value(network, t)
+            reachable, cut_edges = min_cut(network, s)
+
+            self.draw_graph(flows=network.flows(), cut=(reachable, cut_edges))
+            details = ", ".join(f"{value} {key}" for key, value in stats.items())
+            lines = [header] if header else []
+            lines.append(f"Maximum flow {self.vertex_label(s)} → {self.vertex_label(t)}: {max_flow} (+{added} by {engine}: {details}, {elapsed:.2f} ms)")
+            cut_text = f"Minimum cut: {len(cut_edges)} edges, {int(reachable.sum())} vertices on the source side"
+            if len(cut_edges) <= 20:
+                cut_text += ": " + ", ".join(
+                    f"{self.vertex_label(int(network.tails[e]))}-{self.vertex_label(int(network.heads[e]))}"
+                    for e in cut_edges)
+            lines.append(cut_text)
+            self.result_var.set("\n".join(lines))
             
         except Exception as e:
             self.result_var.set(f"Error during calculation: {str(e)}")
 
-    def draw_graph(self, flows=None):
+    def execute_min_cost_flow(self):
+        """Envoie la valeur demandée (ou le flot maximal) de la source au puits au coût minimal"""
+        try:
+            if self.network is None:
+                raise ValueError("Please generate a graph first")
+            s, t = self.selected_terminals()
+            demand = None
+            if self.demand_entry.get().strip():
+                demand = int(self.demand_entry.get())
+                if demand < 0:
+                    raise ValueError("The flow value must be non-negative")
+
+            start = time.perf_counter()
+            flow, cost, stats = min_cost_flow(self.network, s, t, demand)
+            elapsed = (time.perf_counter() - start) * 1000
+            # Le flot obtenu est valide : un calcul de flot maximal pourra repartir de lui
+            self.terminals = (s, t)
+
+            self.draw_graph(flows=self.network.flows(), show_costs=True)
+            message = (f"Min-cost flow {self.vertex_label(s)} → {self.vertex_label(t)}: {flow} units "
+                       f"at cost {cost} ({stats['augmentations']} augmentations, {elapsed:.2f} ms)")
+            if demand is not None and flow < demand:
+                message += f"\nOnly {flow} of the {demand} requested units can be sent"
+            self.result_var.set(message)
+
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+
+    def update_capacity(self):
+        """Change la capacité d'un arc en réparant le flot courant, puis reprend l'augmentation"""
+        try:
+            if self.network is None:
+                raise ValueError("Please generate a graph first")
+            try:
+                u_label, v_label = [part.strip() for part in self.edge_entry.get().split('-')]
+                capacity = int(self.new_capacity_entry.get())
+            except ValueError:
+                raise ValueError("Enter an edge as S-X1 and a non-negative integer capacity")
+            if capacity < 0:
+                raise ValueError("Capacities must be non-negative")
+            network = self.network
+            u, v = self.vertex_index(u_label), self.vertex_index(v_label)
+            position = np.flatnonzero((network.tails == u) & (network.heads == v))
+            if len(position) == 0:
+                raise ValueError(f"There is no edge {u_label}-{v_label}")
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        edge = int(position[0])
+        old = int(network.capacity[edge])
+        s, t = self.terminals or (0, network.n - 1)
+        stats = change_capacity(network, edge, capacity, s, t)
+        self.reset_gomory_hu()
+        header = f"Edge {u_label}-{v_label}: {old} → {capacity}"
+        if stats['rerouted'] or stats['returned']:
+            header += f" │ flow repaired: {stats['rerouted']} rerouted, {stats['returned']} sent back"
+        self.execute_ford_fulkerson(header=header)
+
+    def reset_gomory_hu(self):
+        if self.gomory_hu_future is not None:
+            self.gomory_hu_future.cancel()
+        self.gomory_hu = None
+        self.gomory_hu_future = None
+
+    def execute_gomory_hu(self):
+        """Coupe minimale entre deux sommets quelconques du réseau vu comme non orienté.
+
+        L'arbre de Gomory-Hu est construit une fois en arrière-plan ; chaque requête parcourt ensuite l'arbre.
+        """
+        try:
+            if self.network is None:
+                raise ValueError("Please generate a graph first")
+            s, t = self.selected_terminals()
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        if self.gomory_hu is not None:
+            self.show_gomory_hu(s, t)
+            return
+        self.result_var.set(f"Building the Gomory-Hu tree ({self.network.n - 1} max-flow computations)...")
+        if self.gomory_hu_future is None:
+            network = self.network
+            self.gomory_hu_future = self.executor.submit(GomoryHuTree, network.n, network.tails,
+                                                         network.heads, network.capacity.copy())
+            self.top.after(100, self.poll_gomory_hu, self.gomory_hu_future)
+
+    def poll_gomory_hu(self, future):
+        if future is not self.gomory_hu_future:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_gomory_hu, future)
+            return
+        try:
+            self.gomory_hu = future.result()
+            self.show_gomory_hu(*self.selected_terminals())
+        except Exception as e:
+            self.result_var.set(f"Error during calculation: {str(e)}")
+
+    def show_gomory_hu(self, s, t):
+        tree = self.gomory_hu
+        network = self.network
+        start = time.perf_counter()
+        value, edge = tree.query(s, t)
+        elapsed = (time.perf_counter() - start) * 1000
+        side = tree.cut_side(edge, s)
+        cut_edges = np.flatnonzero(side[network.tails] != side[network.heads])
+        self.draw_graph(cut=(side, cut_edges))
+        self.result_var.set(
+            f"Minimum cut {self.vertex_label(s)} – {self.vertex_label(t)} (undirected capacities): {value}, "
+            f"{len(cut_edges)} edges, query {elapsed:.3f} ms\n"
+            f"Gomory-Hu tree built in {tree.build_time:.2f} s on {tree.processes} processes "
+            f"({tree.recomputed} speculative cuts recomputed)")
+
+    def generate_bipartite_graph(self):
+        try:
+            n_left = int(self.left_entry.get())
+            n_right = int(self.right_entry.get())
+            avg_degree = float(self.bipartite_degree_entry.get())
+            if n_left < 1 or n_right < 1:
+                raise ValueError("Both sides need at least one vertex")
+            if avg_degree <= 0:
+                raise ValueError("Average degree must be positive")
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+        left, right = generate_bipartite(n_left, n_right, avg_degree)
+        self.set_bipartite([f"L{i + 1}" for i in range(n_left)], [f"R{j + 1}" for j in range(n_right)],
+                           left, right)
+
+    def load_bipartite_graph(self):
+        path = filedialog.askopenfilename(parent=self.top,
+                                          title="Bipartite edge list (one 'left right' pair per line)",
+                                          filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            left_labels, right_labels, left, right = load_bipartite(path)
+            if not len(left):
+                raise ValueError("The file contains no edge")
+        except (OSError, ValueError) as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+        self.set_bipartite(left_labels, right_labels, left, right)
+
+    def set_bipartite(self, left_labels, right_labels, left, right):
+        self.bipartite = (left_labels, right_labels, left, right)
+        self.draw_matching()
+        self.result_var.set(f"Bipartite graph ready: {len(left_labels)} + {len(right_labels)} vertices, "
+                            f"{len(left)} edges. Click 'Maximum Matching'.")
+
+    def execute_matching(self):
+        """Couplage maximum par Hopcroft-Karp, comparé au même problème résolu comme un flot maximal"""
+        if self.bipartite is None:
+            self.result_var.set("Error: Please generate or load a bipartite graph first")
+            return
+        left_labels, right_labels, left, right = self.bipartite
+        n_left, n_right = len(left_labels), len(right_labels)
+
+        start = time.perf_counter()
+        match_left, stats = hopcroft_karp(n_left, n_right, left, right)
+        hk_time = time.perf_counter() - start
+
+        engine = self.engine_var.get()
+        network = matching_network(n_left, n_right, left, right)
+        start = time.perf_counter()
+        flow, _ = ENGINES[engine](network, 0, network.n - 1)
+        flow_time = time.perf_counter() - start
+
+        size = int((match_left >= 0).sum())
+        matched = match_left[left] == right
+        self.draw_matching(matched)
+        lines = [f"Maximum matching: {size} pairs "
+                 f"(Hopcroft-Karp: {hk_time * 1000:.2f} ms, {stats['phases']} phases)",
+                 f"Same problem as a max-flow with {engine}: {flow} units in {flow_time * 1000:.2f} ms "
+                 f"({flow_time / max(hk_time, 1e-9):.1f}x the Hopcroft-Karp time)"]
+        if size <= 20:
+            lines.append(", ".join(f"{left_labels[i]}-{right_labels[j]}"
+                                   for i, j in enumerate(match_left.tolist()) if j >= 0))
+        self.result_var.set("\n".join(lines))
+
+    def draw_matching(self, matched=None):
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
+
+        left_labels, right_labels, left, right = self.bipartite
+        n_left, n_right = len(left_labels), len(right_labels)
+        if n_left + n_right > MAX_DRAW_VERTICES:
+            tk.Label(self.graph_frame,
+                     text=f"Graph too large to draw ({n_left} + {n_right} vertices, {len(left)} edges)",
+                     font=("Helvetica Neue", 12),
+                     bg=self.colors['bg'],
+                     fg=self.colors['secondary']).pack(pady=20)
+            return
+
+        fig = Figure(figsize=(12, 8), dpi=100, facecolor=self.colors['bg'])
+        ax = fig.add_subplot(111)
+        ax.set_facecolor(self.colors['bg'])
+
+        # Deux colonnes : sommets gauches à x = 0, sommets droits à x = 1
+        G = nx.Graph()
+        pos = {}
+        for i in range(n_left):
+            G.add_node(('L', i))
+            pos[('L', i)] = (0, -i / max(n_left - 1, 1))
+        for j in range(n_right):
+            G.add_node(('R', j))
+            pos[('R', j)] = (1, -j / max(n_right - 1, 1))
+        edges = [(('L', i), ('R', j)) for i, j in zip(left.tolist(), right.tolist())]
+        G.add_edges_from(edges)
+        labels = {('L', i): label for i, label in enumerate(left_labels)}
+        labels.update({('R', j): label for j, label in enumerate(right_labels)})
+
+        nx.draw_networkx_edges(G, pos, edgelist=edges, edge_color=self.colors['edge'], width=2, ax=ax)
+        if matched is not None:
+            nx.draw_networkx_edges(G, pos,
+                                   edgelist=[e for e, m in zip(edges, matched.tolist()) if m],
+                                   edge_color=self.colors['path'],
+                                   width=4,
+                                   ax=ax)
+        nx.draw_networkx_nodes(G, pos, node_color=self.colors['node'], node_size=800, ax=ax)
+        nx.draw_networkx_labels(G, pos, labels=labels, font_size=11,
+                                font_color=self.colors['secondary'], ax=ax)
+        ax.margins(0.1)
+        ax.axis('off')
+
+        canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+
+    def draw_graph(self, flows=None, cut=None, show_costs=False):
         for widget in self.graph_frame.winfo_children():
             widget.destroy()
         
+        network = self.network
+        if self.G is None:
+            tk.Label(self.graph_frame,
+                     text=f"Graph too large to draw ({network.n} vertices, "
+                          f"{len(network.tails)} edges)",
+                     font=("Helvetica Neue", 12),
+                     bg=self.colors['bg'],
+                     fg=self.colors['secondary']).pack(pady=20)
+            return
+
         fig = Figure(figsize=(12, 8), dpi=100, facecolor=self.colors['bg'])
         ax = fig.add_subplot(111)
         ax.set_facecolor(self.colors['bg'])
         
-        G = nx.DiGraph()
-        node_labels = {0: 'S', len(self.initial_graph) - 1: 'T'}
-        for i in range(1, len(self.initial_graph) - 1):
-            node_labels[i] = f'X{i}'
+        G = self.G
+        node_labels = {i: self.vertex_label(i) for i in range(network.n)}
 
-        # Add edges to the graph
+        # Étiquettes des arcs : flot/capacité après calcul, capacité sinon
         edge_labels = {}
-        for u in range(len(self.initial_graph)):
-            for v in range(len(self.initial_graph[u])):
-                if self.initial_graph[u][v] > 0:
-                    G.add_edge(u, v)
-                    if flows:
-                        edge_labels[(u, v)] = f"{flows[u][v]}/{self.initial_graph[u][v]}"
-                    else:
-                        edge_labels[(u, v)] = str(self.initial_graph[u][v])
+        capacities = network.capacity.tolist()
+        flow_values = flows.tolist() if flows is not None else None
+        costs = network.cost.tolist()
+        for i, (u, v) in enumerate(zip(network.tails.tolist(), network.heads.tolist())):
+            if flow_values is not None:
+                edge_labels[(u, v)] = f"{flow_values[i]}/{capacities[i]}"
+            else:
+                edge_labels[(u, v)] = str(capacities[i])
+            if show_costs:
+                edge_labels[(u, v)] += f" @{costs[i]}"
         
-        pos = nx.spring_layout(G, k=1, iterations=50)
+        pos = self.pos
         
         # Draw edges
         nx.draw_networkx_edges(G, pos,
@@ -308,10 +1540,24 @@ class FordFulkersonApp:
                              ax=ax,
                              arrows=True,
                              arrowsize=20)
+
+        # Coupe minimale : arcs coupés et sommets du côté de la source
+        node_colors = self.colors['node']
+        if cut is not None:
+            reachable, cut_edges = cut
+            nx.draw_networkx_edges(G, pos,
+                                 edgelist=list(zip(network.tails[cut_edges].tolist(),
+                                                   network.heads[cut_edges].tolist())),
+                                 edge_color=self.colors['path'],
+                                 width=3,
+                                 ax=ax,
+                                 arrows=True,
+                                 arrowsize=20)
+            node_colors = [self.colors['rose'] if reachable[i] else self.colors['node'] for i in G.nodes()]
         
         # Draw nodes
         nx.draw_networkx_nodes(G, pos,
-                             node_color=self.colors['node'],
+                             node_color=node_colors,
                              node_size=1200,
                              ax=ax)
         
@@ -1,41 +1,804 @@
 import tkinter as tk
-from tkinter import messagebox, Frame, Label, Button, Entry, StringVar, Toplevel
+from tkinter import messagebox, Frame, Label, Button, Entry, StringVar, Toplevel, ttk, filedialog
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 import networkx as nx
 import matplotlib.pyplot as plt
-import random
+import itertools
+import numpy as np
+import os
 import string
+import tempfile
+import time
+from interfaceDijkstra import MAX_DRAW_VERTICES
 
+# Densité à partir de laquelle Prim sur la matrice des poids (O(n²)) remplace le tri des arêtes
+PRIM_DENSITY = 0.5
+# Taille maximale de la matrice des poids de Prim (n × n flottants)
+PRIM_MAX_VERTICES = 8000
+# Avec des poids entiers (ceux de la fenêtre : 1 à 100), np.argsort est bien plus rapide et
+# Kruskal dépasse Prim sur le graphe complet au-delà de ce nombre de sommets
+PRIM_INTEGER_MAX_VERTICES = 750
+# Nombre de sommets à partir duquel Borůvka vectorisé est préféré à Kruskal sur un graphe creux :
+# la boucle union-find de Kruskal devient alors plus coûteuse que les tours vectoriels
+BORUVKA_MIN_VERTICES = 1500000
+MST_ENGINES = ["Auto", "Kruskal", "Prim (dense)", "Borůvka"]
+# Enregistrement binaire d'une arête dans les fichiers lus hors mémoire
+EDGE_DTYPE = np.dtype([('u', '<i4'), ('v', '<i4'), ('w', '<f8')])
+# Budget mémoire par défaut du Kruskal hors mémoire (octets)
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+# Taille des sous-blocs filtrés en vectoriel avant la boucle union-find du Kruskal hors mémoire
+UNION_BLOCK = 1 << 16
+# Nombre maximal d'arêtes chargées dans l'arbre couvrant dynamique (listes d'adjacence Python)
+DYNAMIC_MAX_EDGES = 2000000
+# Nombre de voisins retenus par point dans le mode euclidien : les arêtes de l'arbre euclidien
+# relient des voisins proches, 8 suffisent en pratique pour des points répartis uniformément
+EUCLIDEAN_NEIGHBORS = 8
+# Nombre moyen de points par cellule de la grille uniforme
+CELL_POINTS = 3
+# Nombre de points traités par bloc lors de la recherche des plus proches voisins
+KNN_BLOCK = 1 << 16
+# Au-delà, les points sont dessinés sans étiquettes
+MAX_DRAW_POINTS = 20000
 
-def generate_graph(num_vertices):
-    def generate_labels(n):
-        labels = []
-        alphabet = string.ascii_uppercase
-        for i in range(n):
-            label = ""
-            temp = i
-            while temp >= 0:
-                label = alphabet[temp % 26] + label
-                temp = temp // 26 - 1
-            labels.append(label)
-        return labels
 
-    labels = generate_labels(num_vertices)
+def generate_labels(n):
+    labels = []
+    alphabet = string.ascii_uppercase
+    for i in range(n):
+        label = ""
+        temp = i
+        while temp >= 0:
+            label = alphabet[temp % 26] + label
+            temp = temp // 26 - 1
+        labels.append(label)
+    return labels
 
-    G = nx.Graph()
-    for i in range(num_vertices):
-        for j in range(i + 1, num_vertices):
-            weight = random.randint(1, 100)
-            G.add_edge(labels[i], labels[j], weight=weight)
 
-    return G
+def generate_edge_arrays(num_vertices, seed=None):
+    """Graphe complet aléatoire en tableaux (u, v, w), poids entiers de 1 à 100"""
+    rng = np.random.default_rng(seed)
+    u, v = np.triu_indices(num_vertices, k=1)
+    w = rng.integers(1, 101, len(u), dtype=np.int32)
+    return u.astype(np.int32), v.astype(np.int32), w
 
 
-def apply_kruskal(G):
-    mst = nx.minimum_spanning_edges(G, algorithm="kruskal", data=True)
-    mst_edges = list(mst)
-    total_cost = sum([data['weight'] for u, v, data in mst_edges])
-    return mst_edges, total_cost
+def kruskal_arrays(n, u, v, w, chunk=1 << 16):
+    """Kruskal sur tableaux : tri des arêtes par np.argsort puis union-find
+    (compression par moitié, union par rang), arrêt dès que n - 1 arêtes sont retenues.
+
+    Les arêtes triées sont parcourues par blocs de taille croissante ; dans chaque bloc, les
+    racines des extrémités sont d'abord calculées en vectoriel pour écarter les arêtes déjà
+    internes à une composante, et seules les autres passent par la boucle union-find.
+    Retourne (indices des arêtes de l'arbre, coût total).
+    """
+    order = np.argsort(w)
+    parent = list(range(n))
+    rank = [0] * n
+    chosen = []
+    needed = n - 1
+    begin = 0
+    while begin < len(order) and len(chosen) < needed:
+        block = order[begin:begin + chunk]
+        begin += chunk
+        chunk = min(chunk * 2, 1 << 22)
+
+        links = np.array(parent)
+        ru, rv = links[u[block]], links[v[block]]
+        while True:
+            nu, nv = links[ru], links[rv]
+            if np.array_equal(nu, ru) and np.array_equal(nv, rv):
+                break
+            ru, rv = nu, nv
+        block = block[ru != rv]
+
+        for k, a, b in zip(block.tolist(), u[block].tolist(), v[block].tolist()):
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+            chosen.append(k)
+            if len(chosen) == needed:
+                break
+    chosen = np.array(chosen, dtype=np.int64)
+    return chosen, w[chosen].sum().item()
+
+
+def dense_prim(W):
+    """Prim en O(n²) sur la matrice des poids (np.inf sans arête) : un balayage vectoriel par sommet.
+
+    Retourne les arêtes (parents, sommets) de la forêt couvrante minimale.
+    """
+    n = len(W)
+    key = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    tails, heads = [], []
+    for _ in range(n):
+        candidates = np.where(in_tree, np.inf, key)
+        x = int(np.argmin(candidates))
+        if candidates[x] == np.inf:
+            # Nouvelle composante : x devient une racine
+            x = int(np.flatnonzero(~in_tree)[0])
+        elif parent[x] >= 0:
+            tails.append(int(parent[x]))
+            heads.append(x)
+        in_tree[x] = True
+        closer = ~in_tree & (W[x] < key)
+        key[closer] = W[x][closer]
+        parent[closer] = x
+    return np.array(tails, dtype=np.int64), np.array(heads, dtype=np.int64)
+
+
+def boruvka_arrays(n, u, v, w):
+    """Borůvka vectorisé : à chaque tour, chaque composante choisit son arête sortante minimale
+    (ordre total : position dans le tri par poids, donc sans cycle) par un minimum dispersé.
+
+    Chaque composante s'accroche à la composante visée ; dans chaque arbre d'accroches, le seul
+    couple mutuel désigne la racine, et les sauts de pointeurs donnent les nouvelles étiquettes.
+    Retourne les indices des arêtes de la forêt couvrante minimale.
+    """
+    edge_ids = np.argsort(w)
+    eu, ev = u[edge_ids], v[edge_ids]
+    comp = np.arange(n)
+    chosen = []
+    while len(edge_ids):
+        cu, cv = comp[eu], comp[ev]
+        active = cu != cv
+        if not active.all():
+            eu, ev, edge_ids, cu, cv = eu[active], ev[active], edge_ids[active], cu[active], cv[active]
+        if not len(edge_ids):
+            break
+
+        # Les arêtes étant triées, la meilleure arête d'une composante est celle de plus petite position
+        position = np.arange(len(edge_ids))
+        best = np.full(n, len(edge_ids))
+        np.minimum.at(best, cu, position)
+        np.minimum.at(best, cv, position)
+        components = np.flatnonzero(best < len(edge_ids))
+        picked = best[components]
+        target = np.where(cu[picked] == components, cv[picked], cu[picked])
+        chosen.append(edge_ids[np.unique(picked)])
+
+        hook = np.arange(n)
+        hook[components] = target
+        mutual = (hook[target] == components) & (components < target)
+        hook[components[mutual]] = components[mutual]
+        while True:
+            jumped = hook[hook]
+            if np.array_equal(jumped, hook):
+                break
+            hook = jumped
+        comp = hook[comp]
+    return np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
+
+
+def select_mst_engine(n, m, integer_weights=False):
+    """Prim dense au-delà de PRIM_DENSITY de la densité, Borůvka pour les graphes creux de très grande taille"""
+    density = 2 * m / (n * (n - 1)) if n > 1 else 0.0
+    max_vertices = PRIM_INTEGER_MAX_VERTICES if integer_weights else PRIM_MAX_VERTICES
+    if density >= PRIM_DENSITY and n <= max_vertices:
+        return "Prim (dense)"
+    if n >= BORUVKA_MIN_VERTICES:
+        return "Borůvka"
+    return "Kruskal"
+
+
+def minimum_spanning_arrays(n, u, v, w, engine="Auto"):
+    """Arbre (forêt) couvrant minimal par le moteur demandé ou choisi selon la densité.
+
+    Retourne (extrémités a, extrémités b, poids, coût total, moteur utilisé).
+    """
+    if engine == "Auto":
+        engine = select_mst_engine(n, len(u), np.issubdtype(np.asarray(w).dtype, np.integer))
+    if engine == "Prim (dense)":
+        loops = u == v
+        if loops.any():
+            u, v, w = u[~loops], v[~loops], w[~loops]
+        W = np.full((n, n), np.inf)
+        W[u, v] = w
+        W[v, u] = w
+        if np.count_nonzero(np.isfinite(W)) != 2 * len(u):
+            # Arêtes multiples : on garde le poids minimal de chaque paire
+            W[u, v] = np.inf
+            W[v, u] = np.inf
+            np.minimum.at(W, (u, v), w)
+            np.minimum.at(W, (v, u), w)
+        a, b = dense_prim(W)
+        weights = W[a, b]
+        if np.issubdtype(np.asarray(w).dtype, np.integer):
+            weights = weights.astype(np.asarray(w).dtype)
+    else:
+        if engine == "Borůvka":
+            chosen = boruvka_arrays(n, u, v, w)
+        else:
+            chosen, _ = kruskal_arrays(n, u, v, w)
+        a, b, weights = u[chosen], v[chosen], w[chosen]
+    return a, b, weights, weights.sum().item(), engine
+
+
+def generate_points(num_points, seed=None):
+    """Nuage de points uniformes dans le carré unité"""
+    return np.random.default_rng(seed).random((num_points, 2))
+
+
+def grid_knn(points, k):
+    """k plus proches voisins de chaque point par une grille uniforme d'environ CELL_POINTS points par cellule.
+
+    Chaque point examine les cellules voisines de la sienne ; les points dont le k-ième voisin
+    est plus loin que le bord du carré exploré sont repris avec un carré deux fois plus grand.
+    Retourne (voisins, distances), deux tableaux n × k triés par distance croissante.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    k = min(k, n - 1)
+    lo = points.min(axis=0)
+    extent = points.max(axis=0) - lo
+    h = max(np.sqrt(extent[0] * extent[1] * CELL_POINTS / n), extent.max() * CELL_POINTS / n)
+    if h == 0:
+        h = 1.0
+    gx, gy = (extent // h).astype(np.int64) + 1
+    cx = np.minimum(((points[:, 0] - lo[0]) // h).astype(np.int64), gx - 1)
+    cy = np.minimum(((points[:, 1] - lo[1]) // h).astype(np.int64), gy - 1)
+    # Points rangés par cellule
+    order = np.argsort(cy * gx + cx)
+    cx, cy = cx[order], cy[order]
+    x, y = points[order, 0] - lo[0], points[order, 1] - lo[1]
+    start = np.searchsorted(cy * gx + cx, np.arange(gx * gy + 1))
+    counts = np.diff(start)
+
+    neighbors = np.empty((n, k), dtype=np.int64)
+    distances = np.empty((n, k))
+    pending = np.arange(n)
+    ring = 1
+    while len(pending):
+        span = np.arange(-ring, ring + 1)
+        dx = np.tile(span, len(span))
+        dy = np.repeat(span, len(span))
+        unresolved = []
+        for begin in range(0, len(pending), KNN_BLOCK):
+            q = pending[begin:begin + KNN_BLOCK]
+            qx = cx[q][:, None] + dx
+            qy = cy[q][:, None] + dy
+            inside = (qx >= 0) & (qx < gx) & (qy >= 0) & (qy < gy)
+            cells = np.where(inside, qy * gx + qx, 0).ravel()
+            count = np.where(inside.ravel(), counts[cells], 0)
+            row_count = count.reshape(len(q), -1).sum(axis=1)
+            total = int(row_count.sum())
+            # Candidats rangés requête par requête, sans remplissage
+            offset = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+            c = np.repeat(start[cells], count) + offset
+            row_start = np.cumsum(row_count) - row_count
+            width = max(int(row_count.max()), k)
+            # Position de chaque candidat dans la matrice (requêtes × candidats) complétée par +inf
+            slot = np.arange(total) + np.repeat(np.arange(len(q)) * width - row_start, row_count)
+            dist = ((x[c] - np.repeat(x[q], row_count)) ** 2
+                    + (y[c] - np.repeat(y[q], row_count)) ** 2)
+            dist[c == np.repeat(q, row_count)] = np.inf
+            d = np.full(len(q) * width, np.inf)
+            d[slot] = dist
+            d = d.reshape(len(q), width)
+            part = np.argpartition(d, k - 1, axis=1)[:, :k]
+            dk = np.take_along_axis(d, part, axis=1)
+            rank = np.argsort(dk, axis=1)
+            part = np.take_along_axis(part, rank, axis=1)
+            dk = np.take_along_axis(dk, rank, axis=1)
+            found = c[np.minimum(part + row_start[:, None], total - 1)]
+            # Le résultat est sûr si le k-ième voisin est plus proche que le bord du carré exploré
+            margin = np.minimum.reduce([x[q] - (cx[q] - ring) * h, (cx[q] + ring + 1) * h - x[q],
+                                        y[q] - (cy[q] - ring) * h, (cy[q] + ring + 1) * h - y[q]])
+            sure = (dk[:, -1] <= margin ** 2) | (ring >= max(gx, gy))
+            neighbors[q[sure]] = found[sure]
+            distances[q[sure]] = dk[sure]
+            unresolved.append(q[~sure])
+        pending = np.concatenate(unresolved)
+        ring *= 2
+
+    result = np.empty_like(neighbors)
+    result[order] = order[neighbors]
+    final = np.empty_like(distances)
+    final[order] = np.sqrt(distances)
+    return result, final
+
+
+def euclidean_mst(points, k=EUCLIDEAN_NEIGHBORS, engine="Auto"):
+    """Arbre couvrant euclidien calculé sur le graphe des k plus proches voisins.
+
+    C'est l'arbre exact dès que ce graphe contient toutes les arêtes de l'arbre euclidien, ce qui
+    est le cas en pratique pour k = 8 ; si le graphe n'est pas connexe, k est doublé.
+    En mode Auto, Borůvka est utilisé : sur ces graphes géométriques, les composantes
+    fusionnent en quelques tours.
+
+    Retourne (extrémités a, extrémités b, longueurs, longueur totale, statistiques).
+    """
+    n = len(points)
+    if engine == "Auto":
+        engine = "Borůvka"
+    if engine == "Prim (dense)" and n > PRIM_MAX_VERTICES:
+        raise ValueError(f"Prim (dense) is limited to {PRIM_MAX_VERTICES} points")
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0), 0.0, {'neighbors': 0, 'candidate edges': 0, 'engine': engine,
+                                                'knn seconds': 0.0, 'mst seconds': 0.0}
+    k = min(k, n - 1)
+    while True:
+        start = time.perf_counter()
+        neighbors, distances = grid_knn(points, k)
+        u = np.repeat(np.arange(n), k)
+        v = neighbors.ravel()
+        w = distances.ravel()
+        # Une paire voisine dans les deux sens n'est gardée qu'une fois : pour u > v, l'arête figure déjà
+        # dans la liste de v si elle est plus courte que le k-ième voisin de v
+        keep = (u < v) | (w >= distances[v, -1])
+        u, v, w = u[keep], v[keep], w[keep]
+        knn_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        a, b, weights, total, engine = minimum_spanning_arrays(n, u, v, w, engine)
+        mst_seconds = time.perf_counter() - start
+        if len(a) == n - 1 or k == n - 1:
+            break
+        k = min(2 * k, n - 1)
+
+    stats = {'neighbors': k, 'candidate edges': len(u), 'engine': engine,
+             'knn seconds': knn_seconds, 'mst seconds': mst_seconds}
+    return a, b, weights, total, stats
+
+
+def write_edge_file(path, u, v, w):
+    """Écrit des arêtes au format binaire EDGE_DTYPE (u int32, v int32, w float64)"""
+    edges = np.empty(len(u), dtype=EDGE_DTYPE)
+    edges['u'], edges['v'], edges['w'] = u, v, w
+    edges.tofile(path)
+
+
+def read_edge_chunks(path, chunk_edges):
+    """Lit un fichier d'arêtes par blocs de chunk_edges enregistrements EDGE_DTYPE.
+
+    Fichiers .csv / .txt : lignes « u,v,w » (en-tête facultatif, # pour les commentaires) ;
+    autres extensions : enregistrements binaires EDGE_DTYPE bruts.
+    """
+    if os.path.splitext(path)[1].lower() in ('.csv', '.txt'):
+        with open(path, encoding="utf-8") as f:
+            first = f.readline()
+            lines = itertools.chain([first], f)
+            try:
+                [float(x) for x in first.split('#', 1)[0].replace(',', ' ').split()]
+            except ValueError:
+                lines = f
+            while True:
+                chunk = [line for line in itertools.islice(lines, chunk_edges)
+                         if line.split('#', 1)[0].strip()]
+                if not chunk:
+                    return
+                block = np.loadtxt(chunk, delimiter=',', comments='#', ndmin=2)
+                edges = np.empty(len(block), dtype=EDGE_DTYPE)
+                edges['u'], edges['v'], edges['w'] = block[:, 0], block[:, 1], block[:, 2]
+                yield edges
+    else:
+        with open(path, 'rb') as f:
+            while True:
+                edges = np.fromfile(f, dtype=EDGE_DTYPE, count=chunk_edges)
+                if not len(edges):
+                    return
+                yield edges
+
+
+def external_kruskal(path, memory_budget=DEFAULT_MEMORY_BUDGET, n=None, tmpdir=None):
+    """Kruskal hors mémoire pour les fichiers d'arêtes plus grands que la RAM.
+
+    1. Lecture par blocs, chaque bloc trié par poids est écrit dans un fichier temporaire mappé.
+    2. Fusion des k séquences triées par blocs : on émet d'un coup toutes les arêtes de poids
+       inférieur ou égal au plus petit dernier poids chargé, triées ensemble.
+    3. Union-find sur n sommets (tableaux NumPy), arrêt dès que la forêt est couvrante.
+    Les blocs et tampons sont dimensionnés pour rester sous memory_budget (octets).
+
+    Retourne (u, v, w de l'arbre, coût total, statistiques).
+    """
+    record = EDGE_DTYPE.itemsize
+    start = time.perf_counter()
+    # Bloc lu, indices de tri, copie triée et pages de la séquence écrite tiennent ensemble dans le budget
+    chunk_edges = max(memory_budget // (4 * record + 8), 1024)
+    max_vertex = -1
+    total_edges = 0
+
+    def read_run(i, begin, count):
+        # Projection ouverte le temps de la copie : les pages lues ne restent pas résidentes
+        run = np.memmap(runs[i], dtype=EDGE_DTYPE, mode='r', shape=(lengths[i],))
+        block = np.array(run[begin:begin + count])
+        del run
+        return block
+
+    with tempfile.TemporaryDirectory(prefix="kruskal_", dir=tmpdir) as workdir:
+        runs, lengths = [], []
+        for edges in read_edge_chunks(path, chunk_edges):
+            max_vertex = max(max_vertex, int(edges['u'].max()), int(edges['v'].max()))
+            total_edges += len(edges)
+            runs.append(os.path.join(workdir, f"run{len(runs)}.bin"))
+            lengths.append(len(edges))
+            run = np.memmap(runs[-1], dtype=EDGE_DTYPE, mode='w+', shape=(len(edges),))
+            run[:] = edges[np.argsort(edges['w'])]
+            run.flush()
+            del run, edges
+        if n is None:
+            n = max_vertex + 1
+        elif max_vertex >= n:
+            raise ValueError(f"Vertex {max_vertex} out of range for n = {n}")
+
+        # Union-find (parent int32 + rang int8) et arbre (u, v int32 + w float64) ;
+        # le reste du budget va aux tampons de fusion
+        fixed_bytes = 21 * n
+        buffer_edges = (memory_budget - fixed_bytes) // (max(len(runs), 1) * (4 * record + 8))
+        if buffer_edges < 1024:
+            raise MemoryError(f"Memory budget too small for {n} vertices and {len(runs)} sorted runs")
+        parent = np.arange(n, dtype=np.int32)
+        rank = np.zeros(n, dtype=np.int8)
+        tree_u = np.empty(max(n - 1, 0), dtype=np.int32)
+        tree_v = np.empty(max(n - 1, 0), dtype=np.int32)
+        tree_w = np.empty(max(n - 1, 0))
+
+        accepted = 0
+        needed = n - 1
+        cursors = [0] * len(runs)
+        consumed = 0
+        while accepted < needed:
+            blocks = [(i, read_run(i, cursors[i], buffer_edges))
+                      for i in range(len(runs)) if cursors[i] < lengths[i]]
+            if not blocks:
+                break
+            # Les séquences encore incomplètes bornent ce qui peut être émis sans risque
+            pending = [block['w'][-1] for i, block in blocks if cursors[i] + len(block) < lengths[i]]
+            cutoff = min(pending) if pending else np.inf
+            batch = []
+            for i, block in blocks:
+                count = int(np.searchsorted(block['w'], cutoff, side='right'))
+                batch.append(block[:count])
+                cursors[i] += count
+            del blocks
+            batch = np.concatenate(batch)
+            batch = batch[np.argsort(batch['w'])]
+            consumed += len(batch)
+
+            # Par sous-blocs : racines courantes en vectoriel, les arêtes internes à une
+            # composante sont écartées avant la boucle union-find
+            for begin in range(0, len(batch), UNION_BLOCK):
+                if accepted == needed:
+                    break
+                block = batch[begin:begin + UNION_BLOCK]
+                ru, rv = parent[block['u']], parent[block['v']]
+                while True:
+                    nu, nv = parent[ru], parent[rv]
+                    if np.array_equal(nu, ru) and np.array_equal(nv, rv):
+                        break
+                    ru, rv = nu, nv
+                block = block[ru != rv]
+                for a, b, weight in zip(block['u'].tolist(), block['v'].tolist(), block['w'].tolist()):
+                    x, y = a, b
+                    while parent[x] != x:
+                        parent[x] = parent[parent[x]]
+                        x = int(parent[x])
+                    while parent[y] != y:
+                        parent[y] = parent[parent[y]]
+                        y = int(parent[y])
+                    if x == y:
+                        continue
+                    if rank[x] < rank[y]:
+                        x, y = y, x
+                    parent[y] = x
+                    if rank[x] == rank[y]:
+                        rank[x] += 1
+                    tree_u[accepted], tree_v[accepted], tree_w[accepted] = a, b, weight
+                    accepted += 1
+                    if accepted == needed:
+                        break
+            del batch
+
+    u, v, w = tree_u[:accepted], tree_v[:accepted], tree_w[:accepted]
+    stats = {'vertices': n, 'edges': total_edges, 'edges merged': consumed, 'runs': len(cursors),
+             'seconds': time.perf_counter() - start}
+    return u, v, w, w.sum().item(), stats
+
+
+class LinkCutTree:
+    """Forêt d'arbres link-cut (arbres splay sur les chemins préférés) : liaison, coupure,
+    connexité et sommet de valeur maximale sur un chemin en O(log n) amorti.
+
+    Les nœuds sont numérotés à partir de 1, l'indice 0 sert de nœud nul."""
+
+    def __init__(self, size):
+        size += 1
+        self.left = [0] * size
+        self.right = [0] * size
+        self.parent = [0] * size
+        self.flip = [False] * size
+        self.value = [float('-inf')] * size
+        # Nœud de valeur maximale du sous-arbre splay
+        self.best = list(range(size))
+
+    def _is_root(self, x):
+        p = self.parent[x]
+        return p == 0 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flip[x]:
+            self.flip[x] = False
+            l, r = self.left[x], self.right[x]
+            self.left[x], self.right[x] = r, l
+            if l:
+                self.flip[l] = not self.flip[l]
+            if r:
+                self.flip[r] = not self.flip[r]
+
+    def _pull(self, x):
+        value, best = self.value, self.best
+        b = x
+        l, r = self.left[x], self.right[x]
+        if l and value[best[l]] > value[b]:
+            b = best[l]
+        if r and value[best[r]] > value[b]:
+            b = best[r]
+        best[x] = b
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x]:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x]:
+                parent[left[x]] = p
+            left[x] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # Propagation des inversions de la racine splay vers x
+        stack = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            stack.append(y)
+        for y in reversed(stack):
+            self._push(y)
+        while not self._is_root(x):
+            p = self.parent[x]
+            if not self._is_root(p):
+                g = self.parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        last = 0
+        y = x
+        while y:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        self._access(x)
+        self._push(x)
+        while self.left[x]:
+            x = self.left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        self.make_root(x)
+        self._access(y)
+        # x est alors le fils gauche de y, sans autre nœud entre eux
+        self.left[y] = 0
+        self.parent[x] = 0
+        self._pull(y)
+
+    def set_value(self, x, value):
+        self._access(x)
+        self.value[x] = value
+        self._pull(x)
+
+    def path_max(self, x, y):
+        """Nœud de valeur maximale sur le chemin de x à y (supposés connectés)"""
+        self.make_root(x)
+        self._access(y)
+        return self.best[y]
+
+
+class DynamicMST:
+    """Arbre (forêt) couvrant minimal maintenu sous insertions, suppressions et changements de poids.
+
+    Les arêtes de l'arbre sont des nœuds d'un arbre link-cut portant leur poids, ce qui donne
+    l'arête maximale d'un chemin de l'arbre. Une insertion remplace l'arête maximale du cycle
+    formé ; une suppression parcourt le plus petit des deux morceaux de l'arbre (parcours alternés)
+    et retient l'arête la moins chère qui les reconnecte."""
+
+    def __init__(self, n, u, v, w):
+        self.n = n
+        self.adj = [{} for _ in range(n)]
+        for a, b, weight in zip(u.tolist(), v.tolist(), w.tolist()):
+            if a != b and (b not in self.adj[a] or weight < self.adj[a][b]):
+                self.adj[a][b] = weight
+                self.adj[b][a] = weight
+        self.tree_adj = [set() for _ in range(n)]
+        # Sommet x -> nœud x + 1 ; arêtes de l'arbre -> nœuds n + 1 .. 2n - 1
+        self.lct = LinkCutTree(2 * n)
+        self.free_nodes = list(range(2 * n - 1, n, -1))
+        self.edge_node = {}
+        self.node_edge = {}
+        self.total_cost = 0
+
+        a, b, weights, _, _ = minimum_spanning_arrays(n, u, v, w)
+        for x, y, weight in zip(a.tolist(), b.tolist(), weights.tolist()):
+            self._add_tree_edge(x, y, weight)
+
+    @staticmethod
+    def _key(a, b):
+        return (a, b) if a < b else (b, a)
+
+    def _check(self, a, b):
+        if not (0 <= a < self.n and 0 <= b < self.n):
+            raise ValueError(f"Vertices must be between 0 and {self.n - 1}")
+        if a == b:
+            raise ValueError("Self-loops are not allowed")
+
+    def _add_tree_edge(self, a, b, weight):
+        node = self.free_nodes.pop()
+        key = self._key(a, b)
+        self.edge_node[key] = node
+        self.node_edge[node] = key
+        self.lct.set_value(node, weight)
+        self.lct.link(a + 1, node)
+        self.lct.link(node, b + 1)
+        self.tree_adj[a].add(b)
+        self.tree_adj[b].add(a)
+        self.total_cost += weight
+
+    def _remove_tree_edge(self, a, b):
+        key = self._key(a, b)
+        node = self.edge_node.pop(key)
+        del self.node_edge[node]
+        weight = self.lct.value[node]
+        self.lct.cut(a + 1, node)
+        self.lct.cut(node, b + 1)
+        self.lct.value[node] = float('-inf')
+        self.free_nodes.append(node)
+        self.tree_adj[a].discard(b)
+        self.tree_adj[b].discard(a)
+        self.total_cost -= weight
+        return key + (weight,)
+
+    def _smaller_side(self, a, b):
+        """Sommets du plus petit des morceaux contenant a et b, en O(taille de ce morceau)"""
+        sides = ({a}, {b})
+        stacks = ([a], [b])
+        while True:
+            for side, stack in zip(sides, stacks):
+                if not stack:
+                    return side
+                x = stack.pop()
+                for y in self.tree_adj[x]:
+                    if y not in side:
+                        side.add(y)
+                        stack.append(y)
+
+    def is_tree_edge(self, a, b):
+        return self._key(a, b) in self.edge_node
+
+    def tree_edges(self):
+        return [key + (self.lct.value[node],) for key, node in self.edge_node.items()]
+
+    def edges(self):
+        return [(a, b, weight) for a in range(self.n) for b, weight in self.adj[a].items() if a < b]
+
+    def components(self):
+        return self.n - len(self.edge_node)
+
+    def _offer(self, a, b, weight):
+        """Propose l'arête (a, b) à l'arbre : elle y entre si elle relie deux morceaux
+        ou si elle est moins chère que l'arête maximale du cycle qu'elle ferme"""
+        if not self.lct.connected(a + 1, b + 1):
+            self._add_tree_edge(a, b, weight)
+            return [self._key(a, b) + (weight,)], []
+        heaviest = self.lct.path_max(a + 1, b + 1)
+        if self.lct.value[heaviest] <= weight:
+            return [], []
+        left = self._remove_tree_edge(*self.node_edge[heaviest])
+        self._add_tree_edge(a, b, weight)
+        return [self._key(a, b) + (weight,)], [left]
+
+    def _reconnect(self, a, b):
+        """Reconnecte les morceaux de a et b par l'arête la moins chère qui les relie"""
+        side = self._smaller_side(a, b)
+        replacement = None
+        for x in side:
+            for y, weight in self.adj[x].items():
+                if y not in side and (replacement is None or weight < replacement[2]):
+                    replacement = (x, y, weight)
+        if replacement is None:
+            return []
+        self._add_tree_edge(*replacement)
+        return [self._key(*replacement[:2]) + (replacement[2],)]
+
+    def insert_edge(self, a, b, weight):
+        """Ajoute l'arête (a, b) ; renvoie (arêtes entrées dans l'arbre, arêtes sorties)"""
+        self._check(a, b)
+        if b in self.adj[a]:
+            raise ValueError("Edge already exists, change its weight instead")
+        self.adj[a][b] = weight
+        self.adj[b][a] = weight
+        return self._offer(a, b, weight)
+
+    def delete_edge(self, a, b):
+        """Supprime l'arête (a, b) ; renvoie (arêtes entrées dans l'arbre, arêtes sorties)"""
+        self._check(a, b)
+        if b not in self.adj[a]:
+            raise ValueError("Edge does not exist")
+        del self.adj[a][b]
+        del self.adj[b][a]
+        if not self.is_tree_edge(a, b):
+            return [], []
+        left = self._remove_tree_edge(a, b)
+        return self._reconnect(a, b), [left]
+
+    def reweight_edge(self, a, b, weight):
+        """Change le poids de l'arête (a, b) ; renvoie (arêtes entrées dans l'arbre, arêtes sorties)"""
+        self._check(a, b)
+        if b not in self.adj[a]:
+            raise ValueError("Edge does not exist")
+        old = self.adj[a][b]
+        self.adj[a][b] = weight
+        self.adj[b][a] = weight
+        if not self.is_tree_edge(a, b):
+            return self._offer(a, b, weight) if weight < old else ([], [])
+        if weight <= old:
+            # Une arête de l'arbre qui devient moins chère y reste
+            self.lct.set_value(self.edge_node[self._key(a, b)], weight)
+            self.total_cost += weight - old
+            return [], []
+        left = self._remove_tree_edge(a, b)
+        entered = self._reconnect(a, b)
+        if entered and entered[0][:2] == left[:2]:
+            return [], []
+        return entered, [left]
 
 
 def visualize_graph(G, mst_edges):
@@ -55,6 +818,23 @@ def visualize_graph(G, mst_edges):
     return figure
 
 
+def visualize_points(points, a, b):
+    """Arbre couvrant euclidien dessiné aux coordonnées des points"""
+    figure, ax = plt.subplots()
+    small = len(points) <= MAX_DRAW_VERTICES
+    segments = np.stack([points[a], points[b]], axis=1)
+    ax.add_collection(LineCollection(segments, colors='green', linewidths=2 if small else 0.5))
+    ax.scatter(points[:, 0], points[:, 1], s=60 if small else 2, c='lightblue', zorder=2)
+    if small:
+        for i, (x, y) in enumerate(points.tolist()):
+            ax.annotate(str(i), (x, y), ha='center', va='center', fontsize=7, fontweight='bold')
+    ax.set_aspect('equal')
+    ax.autoscale()
+    ax.axis('off')
+    plt.close(figure)
+    return figure
+
+
 class KruskalApp:
     def __init__(self, parent):
         self.parent = parent
@@ -73,6 +853,12 @@ class KruskalApp:
         }
 
         self.top.configure(bg=self.colors['bg'])
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.external_future = None
+        self.points_future = None
+        # Graphe généré courant (n, u, v, w, étiquettes) et son arbre couvrant dynamique
+        self.graph_arrays = None
+        self.dynamic = None
         self.setup_interface()
 
         self.top.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -81,6 +867,7 @@ class KruskalApp:
         self.return_home()
 
     def return_home(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.top.destroy()
         self.parent.deiconify()
 
@@ -165,6 +952,103 @@ class KruskalApp:
                                  cursor="hand2")
         self.run_button.grid(row=0, column=2, sticky='e', padx=(10, 0))
 
+        Label(input_frame,
+              text="Engine",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).grid(row=1, column=0, padx=(0, 10), pady=(10, 0), sticky='w')
+
+        self.engine_var = StringVar(value="Auto")
+        self.engine_combo = ttk.Combobox(input_frame,
+                                         textvariable=self.engine_var,
+                                         values=MST_ENGINES,
+                                         state="readonly",
+                                         width=20)
+        self.engine_combo.grid(row=1, column=1, pady=(10, 0), sticky='w')
+
+        # Mode euclidien : le nombre de sommets est celui des points du plan
+        self.points_button = Button(input_frame,
+                                    text="Generate Points",
+                                    command=self.generate_points_action,
+                                    font=("Helvetica Neue", 12, "bold"),
+                                    bg=self.colors['rose'],
+                                    fg="white",
+                                    activebackground=self.colors['secondary'],
+                                    activeforeground="white",
+                                    relief="flat",
+                                    bd=0,
+                                    padx=20,
+                                    pady=10,
+                                    cursor="hand2")
+        self.points_button.grid(row=1, column=2, sticky='e', padx=(10, 0), pady=(10, 0))
+
+        # Kruskal hors mémoire sur un fichier d'arêtes
+        Label(input_frame,
+              text="Memory budget (MB)",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).grid(row=2, column=0, padx=(0, 10), pady=(10, 0), sticky='w')
+
+        self.budget_entry = Entry(input_frame,
+                                  font=("Helvetica Neue", 14),
+                                  bd=0,
+                                  bg=self.colors['accent'],
+                                  fg=self.colors['secondary'],
+                                  insertbackground=self.colors['primary'],
+                                  relief="flat",
+                                  width=10)
+        self.budget_entry.insert(0, str(DEFAULT_MEMORY_BUDGET // (1024 * 1024)))
+        self.budget_entry.grid(row=2, column=1, pady=(10, 0), sticky="w")
+
+        self.file_button = Button(input_frame,
+                                  text="Load Edge File...",
+                                  command=self.external_kruskal_action,
+                                  font=("Helvetica Neue", 12, "bold"),
+                                  bg=self.colors['rose'],
+                                  fg="white",
+                                  activebackground=self.colors['secondary'],
+                                  activeforeground="white",
+                                  relief="flat",
+                                  bd=0,
+                                  padx=20,
+                                  pady=10,
+                                  cursor="hand2")
+        self.file_button.grid(row=2, column=2, sticky='e', padx=(10, 0), pady=(10, 0))
+
+        # Modification incrémentale du graphe généré
+        Label(input_frame,
+              text="Edge (u v weight)",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).grid(row=3, column=0, padx=(0, 10), pady=(10, 0), sticky='w')
+
+        self.edge_entry = Entry(input_frame,
+                                font=("Helvetica Neue", 14),
+                                bd=0,
+                                bg=self.colors['accent'],
+                                fg=self.colors['secondary'],
+                                insertbackground=self.colors['primary'],
+                                relief="flat",
+                                width=20)
+        self.edge_entry.grid(row=3, column=1, pady=(10, 0), sticky="w")
+
+        edit_frame = Frame(input_frame, bg=self.colors['bg'])
+        edit_frame.grid(row=3, column=2, sticky='e', padx=(10, 0), pady=(10, 0))
+        for text, operation in (("Insert", "insert"), ("Delete", "delete"), ("Reweight", "reweight")):
+            Button(edit_frame,
+                   text=text,
+                   command=lambda operation=operation: self.edit_edge(operation),
+                   font=("Helvetica Neue", 12, "bold"),
+                   bg=self.colors['rose'],
+                   fg="white",
+                   activebackground=self.colors['secondary'],
+                   activeforeground="white",
+                   relief="flat",
+                   bd=0,
+                   padx=10,
+                   pady=10,
+                   cursor="hand2").pack(side="left", padx=(5, 0))
+
     def create_result_section(self):
         self.result_var = StringVar()
         self.result_var.set("Ready to generate graph")
@@ -192,23 +1076,202 @@ class KruskalApp:
             self.result_var.set("Generating graph...")
             self.main_container.update()
 
-            G = generate_graph(num_vertices)
-            mst_edges, total_cost = apply_kruskal(G)
+            labels = generate_labels(num_vertices)
+            u, v, w = generate_edge_arrays(num_vertices)
+            start = time.perf_counter()
+            a, b, weights, total_cost, engine = minimum_spanning_arrays(num_vertices, u, v, w,
+                                                                        self.engine_var.get())
+            elapsed = time.perf_counter() - start
 
-            self.result_var.set(f"Minimal spanning tree cost: {total_cost}")
+            self.result_var.set(f"Minimal spanning tree cost: {total_cost} "
+                                f"({len(u)} candidate edges, {engine} in {elapsed * 1000:.1f} ms)")
+            self.graph_arrays = (num_vertices, u, v, w, labels)
+            self.dynamic = None
 
-            self.draw_graph(G, mst_edges)
+            # Les étiquettes ne servent qu'à l'affichage
+            if num_vertices <= MAX_DRAW_VERTICES:
+                G = nx.Graph()
+                G.add_nodes_from(labels)
+                G.add_weighted_edges_from((labels[i], labels[j], weight)
+                                          for i, j, weight in zip(u.tolist(), v.tolist(), w.tolist()))
+                mst_edges = [(labels[i], labels[j], {'weight': weight})
+                             for i, j, weight in zip(a.tolist(), b.tolist(), weights.tolist())]
+                self.draw_graph(G, mst_edges)
+            else:
+                self.show_too_large(num_vertices, len(u))
 
         except ValueError as e:
             self.result_var.set(f"Error: {str(e)}")
         except Exception as e:
             self.result_var.set(f"An error occurred: {str(e)}")
 
-    def draw_graph(self, G, mst_edges):
+    def external_kruskal_action(self):
+        """Arbre couvrant minimal d'un fichier d'arêtes (binaire u int32, v int32, w float64 ou CSV u,v,w),
+        calculé hors mémoire en arrière-plan"""
+        try:
+            budget = int(float(self.budget_entry.get()) * 1024 * 1024)
+            if budget <= 0:
+                raise ValueError("The memory budget must be positive")
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+        path = filedialog.askopenfilename(parent=self.top,
+                                          title="Edge file",
+                                          filetypes=[("Binary edge files", "*.bin *.edges"),
+                                                     ("CSV files", "*.csv *.txt"),
+                                                     ("All files", "*.*")])
+        if not path:
+            return
+
+        self.result_var.set(f"Computing the MST of {os.path.basename(path)} out of core...")
+        self.external_future = self.executor.submit(external_kruskal, path, budget)
+        self.top.after(100, self.poll_external, self.external_future, path)
+
+    def poll_external(self, future, path):
+        if future is not self.external_future:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_external, future, path)
+            return
+        try:
+            u, v, w, total_cost, stats = future.result()
+        except (OSError, ValueError, MemoryError) as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        self.graph_arrays = None
+        self.dynamic = None
+        n = stats['vertices']
+        spanning = "spanning tree" if len(u) == n - 1 else f"spanning forest ({n - len(u)} components)"
+        self.result_var.set(f"Minimal {spanning} cost of {os.path.basename(path)}: {total_cost:g}\n"
+                            f"{n} vertices, {stats['edges merged']} of {stats['edges']} edges merged "
+                            f"from {stats['runs']} sorted runs in {stats['seconds']:.2f} s")
+        if n <= MAX_DRAW_VERTICES:
+            # Seul l'arbre est dessiné : le fichier complet n'est pas rechargé en mémoire
+            mst_edges = [(str(a), str(b), {'weight': weight})
+                         for a, b, weight in zip(u.tolist(), v.tolist(), w.tolist())]
+            G = nx.Graph()
+            G.add_nodes_from(str(i) for i in range(n))
+            G.add_edges_from(mst_edges)
+            self.draw_graph(G, mst_edges)
+        else:
+            self.show_too_large(n, stats['edges'])
+
+    def generate_points_action(self):
+        try:
+            num_points = int(self.num_vertices_entry.get())
+            if num_points < 2:
+                raise ValueError("Please enter a number greater than 1.")
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        self.graph_arrays = None
+        self.dynamic = None
+        self.result_var.set(f"Computing the Euclidean MST of {num_points} points...")
+        points = generate_points(num_points)
+        self.points_future = self.executor.submit(euclidean_mst, points, EUCLIDEAN_NEIGHBORS, self.engine_var.get())
+        self.top.after(100, self.poll_points, self.points_future, points)
+
+    def poll_points(self, future, points):
+        if future is not self.points_future:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_points, future, points)
+            return
+        try:
+            a, b, _, total_length, stats = future.result()
+        except (ValueError, MemoryError) as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        self.result_var.set(f"Euclidean minimal spanning tree length: {total_length:.4f}\n"
+                            f"{len(points)} points, {stats['candidate edges']} candidate edges from "
+                            f"{stats['neighbors']} nearest neighbours in {stats['knn seconds'] * 1000:.1f} ms, "
+                            f"{stats['engine']} in {stats['mst seconds'] * 1000:.1f} ms")
+        if len(points) <= MAX_DRAW_POINTS:
+            self.show_figure(visualize_points(points, a, b))
+        else:
+            self.show_too_large(len(points), stats['candidate edges'])
+
+    def dynamic_mst(self):
+        """Arbre couvrant dynamique du graphe courant, construit à la première modification"""
+        if self.graph_arrays is None:
+            raise ValueError("Generate a graph first")
+        if self.dynamic is None:
+            n, u, v, w, _ = self.graph_arrays
+            if len(u) > DYNAMIC_MAX_EDGES:
+                raise ValueError(f"Incremental updates are limited to {DYNAMIC_MAX_EDGES} edges")
+            self.dynamic = DynamicMST(n, u, v, w)
+        return self.dynamic
+
+    def edit_edge(self, operation):
+        try:
+            dynamic = self.dynamic_mst()
+            labels = self.graph_arrays[4]
+            index = {label: i for i, label in enumerate(labels)}
+            fields = self.edge_entry.get().upper().split()
+            if len(fields) != (2 if operation == "delete" else 3):
+                raise ValueError("Enter two vertices" + ("" if operation == "delete" else " and a weight"))
+            if fields[0] not in index or fields[1] not in index:
+                raise ValueError("Unknown vertex")
+            a, b = index[fields[0]], index[fields[1]]
+
+            start = time.perf_counter()
+            if operation == "delete":
+                entered, left = dynamic.delete_edge(a, b)
+            else:
+                weight = float(fields[2])
+                if weight.is_integer():
+                    weight = int(weight)
+                if operation == "insert":
+                    entered, left = dynamic.insert_edge(a, b, weight)
+                else:
+                    entered, left = dynamic.reweight_edge(a, b, weight)
+            elapsed = time.perf_counter() - start
+
+            def describe(edges):
+                return ", ".join(f"{labels[x]}-{labels[y]} ({weight})" for x, y, weight in edges)
+
+            changes = []
+            if left:
+                changes.append(f"removed from tree: {describe(left)}")
+            if entered:
+                changes.append(f"added to tree: {describe(entered)}")
+            components = dynamic.components()
+            spanning = "spanning tree" if components == 1 else f"spanning forest ({components} components)"
+            self.result_var.set(f"Minimal {spanning} cost: {dynamic.total_cost}\n"
+                                f"{'; '.join(changes) or 'tree unchanged'} "
+                                f"(updated in {elapsed * 1000:.2f} ms)")
+
+            n = dynamic.n
+            if n <= MAX_DRAW_VERTICES:
+                G = nx.Graph()
+                G.add_nodes_from(labels)
+                G.add_weighted_edges_from((labels[x], labels[y], weight) for x, y, weight in dynamic.edges())
+                mst_edges = [(labels[x], labels[y], {'weight': weight}) for x, y, weight in dynamic.tree_edges()]
+                self.draw_graph(G, mst_edges)
+            else:
+                self.show_too_large(n, sum(len(neighbors) for neighbors in dynamic.adj) // 2)
+
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+
+    def show_too_large(self, num_vertices, num_edges):
         for widget in self.graph_frame.winfo_children():
             widget.destroy()
+        Label(self.graph_frame,
+              text=f"Graph too large to draw ({num_vertices} vertices, {num_edges} edges)",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).pack(pady=20)
 
-        fig = visualize_graph(G, mst_edges)
+    def draw_graph(self, G, mst_edges):
+        self.show_figure(visualize_graph(G, mst_edges))
+
+    def show_figure(self, fig):
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
 
         canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
         canvas.draw()
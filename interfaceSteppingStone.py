@@ -3,6 +3,11 @@ from tkinter import ttk, messagebox, StringVar
 import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from interfaceDijkstra import (graph_to_csr, integer_weight_bound, bucket_dijkstra, csr_single_source_dijkstra,
+                               build_contraction_hierarchy, ch_single_source_dijkstra)
+
+# À partir de ce nombre de sommets, une hiérarchie de contraction est construite une fois par liste d'arêtes
+CH_MIN_VERTICES = 1000
 
 class SteppingStoneApp:
     def __init__(self, parent):
@@ -25,6 +30,9 @@ class SteppingStoneApp:
         }
 
         self.top.configure(bg=self.colors['bg'])
+
+        # Hiérarchie de contraction de la dernière liste d'arêtes : (arêtes, sommets, csr, ch)
+        self.ch_cache = None
         
         # Container principal
         self.main_container = tk.Frame(self.top, bg=self.colors['bg'], padx=40, pady=30)
@@ -203,9 +211,30 @@ class SteppingStoneApp:
                 return
         
         try:
-            path = nx.shortest_path(graph, source=start_node, target=end_node, weight='weight')
-            path_length = nx.shortest_path_length(graph, source=start_node, target=end_node, weight='weight')
-            self.display_result(f"Shortest path from {start_node} to {end_node}: {' -> '.join(path)}\nPath length: {path_length}")
+            details = ""
+            nodes = list(graph.nodes())
+            if self.ch_cache is not None and self.ch_cache[0] == edges_input:
+                _, nodes, csr, ch = self.ch_cache
+            else:
+                csr = graph_to_csr(graph, nodes)
+                ch = None
+                if len(nodes) >= CH_MIN_VERTICES:
+                    ch = build_contraction_hierarchy(csr)
+                    self.ch_cache = (edges_input, nodes, csr, ch)
+                    details = (f"\nPreprocessing: {ch.preprocessing_time:.2f}s, {ch.shortcut_count} shortcuts, "
+                               f"~{ch.memory_bytes / 1e6:.1f} MB")
+
+            if ch is not None:
+                path_length, path = ch_single_source_dijkstra(nodes, ch, csr, start_node, end_node)
+                details += f"\nContraction hierarchy query, average x{ch.dijkstra_query_time / ch.query_time:.1f} vs Dijkstra"
+            elif integer_weight_bound(csr[2]) is not None:
+                # Poids entiers : file à seaux de Dial (tas binaire au-delà de DIAL_MAX_WEIGHT)
+                path_length, path = csr_single_source_dijkstra(nodes, csr, start_node, end_node,
+                                                               engine=bucket_dijkstra)
+            else:
+                path = nx.shortest_path(graph, source=start_node, target=end_node, weight='weight')
+                path_length = nx.shortest_path_length(graph, source=start_node, target=end_node, weight='weight')
+            self.display_result(f"Shortest path from {start_node} to {end_node}: {' -> '.join(path)}\nPath length: {path_length}{details}")
             self.draw_graph(graph, path)
         except nx.NetworkXNoPath:
             self.display_result("No path exists between the specified nodes.")
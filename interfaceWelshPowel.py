@@ -1,19 +1,347 @@
-import random
+import heapq
+from array import array
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import networkx as nx
+import numpy as np
 import tkinter as tk
-from tkinter import Tk, Label, Entry, Button, Frame, StringVar, Toplevel
+from tkinter import Tk, Label, Entry, Button, Frame, StringVar, Toplevel, ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from interfaceDijkstra import MAX_DRAW_VERTICES
 
-def generate_random_graph(num_vertices):
-    G = nx.Graph()
-    G.add_nodes_from(range(num_vertices))
-    for i in range(num_vertices):
-        for j in range(i + 1, num_vertices):
-            if random.choice([True, False]):
-                G.add_edge(i, j)
-    return G
+# Degré moyen à partir duquel la coloration gloutonne traite les sommets un par un ;
+# en dessous, elle colore par tours tous les sommets dont les voisins précédents sont colorés
+ROUNDS_MAX_DEGREE = 100
+# Nombre maximal d'arêtes du graphe aléatoire généré (une paire sur deux est reliée)
+GENERATION_MAX_EDGES = 20000000
+# Nombre de lignes de la matrice d'adjacence tirées à la fois par le générateur vectoriel
+GENERATION_BLOCK = 1 << 22
+# Durée maximale par défaut de la recherche du nombre chromatique exact (secondes)
+EXACT_TIME_BUDGET = 10.0
+# Nombre maximal de sommets de départ de la clique gloutonne (borne inférieure)
+CLIQUE_MAX_STARTS = 2000
+
+def generate_random_arrays(num_vertices, seed=None):
+    """Graphe aléatoire en tableaux (u, v) : chaque paire de sommets est reliée avec probabilité 1/2"""
+    if num_vertices * (num_vertices - 1) // 4 > GENERATION_MAX_EDGES:
+        raise ValueError(f"Too many vertices: the graph would have more than {GENERATION_MAX_EDGES} edges")
+    rng = np.random.default_rng(seed)
+    us, vs = [], []
+    # Blocs de lignes du triangle supérieur, d'environ GENERATION_BLOCK paires chacun
+    i = 0
+    while i < num_vertices - 1:
+        j = i
+        pairs = 0
+        while j < num_vertices - 1 and pairs < GENERATION_BLOCK:
+            pairs += num_vertices - 1 - j
+            j += 1
+        rows = np.arange(i, j)
+        lengths = num_vertices - 1 - rows
+        u = np.repeat(rows, lengths)
+        v = np.arange(pairs) - np.repeat(np.cumsum(lengths) - lengths, lengths) + u + 1
+        keep = rng.random(pairs) < 0.5
+        us.append(u[keep].astype(np.int32))
+        vs.append(v[keep].astype(np.int32))
+        i = j
+    if not us:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+    return np.concatenate(us), np.concatenate(vs)
+
+def adjacency_arrays(n, u, v):
+    """Listes d'adjacence CSR (indptr, indices) d'un graphe non orienté donné par ses arêtes"""
+    tails = np.concatenate([u, v])
+    heads = np.concatenate([v, u])
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+    indices = heads[np.argsort(tails)].astype(np.int32)
+    return indptr, indices
+
+def degree_order(degree):
+    """Sommets par degré décroissant, tri par dénombrement stable (même ordre que sorted(..., reverse=True))"""
+    buckets = [[] for _ in range(int(degree.max(initial=0)) + 1)]
+    for vertex, d in enumerate(degree.tolist()):
+        buckets[d].append(vertex)
+    return np.array([vertex for bucket in reversed(buckets) for vertex in bucket], dtype=np.int64)
+
+def greedy_coloring(n, indptr, indices, order):
+    """Coloration gloutonne : chaque sommet, dans l'ordre donné, reçoit la plus petite couleur
+    absente de ses voisins déjà colorés. Retourne le tableau des couleurs."""
+    degree = np.diff(indptr)
+    color = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return color
+    if len(indices) >= ROUNDS_MAX_DEGREE * n:
+        # Couleurs interdites marquées avec l'estampille du sommet courant : le tableau n'est jamais
+        # remis à zéro ; la dernière case reçoit les voisins pas encore colorés (couleur -1)
+        mark = np.zeros(int(degree.max()) + 2, dtype=np.int64)
+        for stamp, vertex in enumerate(order.tolist(), 1):
+            mark[color[indices[indptr[vertex]:indptr[vertex + 1]]]] = stamp
+            d = degree[vertex]
+            color[vertex] = np.argmin(mark[:d + 1] == stamp)
+        return color
+
+    # Graphe creux : la couleur d'un sommet ne dépend que de ses voisins placés avant lui dans l'ordre,
+    # on colore donc à chaque tour tous les sommets dont ces voisins sont déjà colorés
+    position = np.empty(n, dtype=np.int64)
+    position[order] = np.arange(n)
+    tails = np.repeat(np.arange(n), degree)
+    earlier = position[indices] < position[tails]
+    pending = np.bincount(tails[earlier], minlength=n)
+    width = int(degree.max()) + 2
+    ready = np.flatnonzero(pending == 0)
+    while len(ready):
+        counts = degree[ready]
+        total = int(counts.sum())
+        arcs = np.repeat(indptr[ready] - np.cumsum(counts) + counts, counts) + np.arange(total)
+        owner = np.repeat(np.arange(len(ready)), counts)
+        heads = indices[arcs]
+        before = earlier[arcs]
+        # Couleurs distinctes des voisins précédents, triées par sommet : la plus petite couleur libre
+        # est le nombre de couleurs égales à leur rang dans leur groupe
+        key = np.unique(owner[before] * width + color[heads[before]])
+        group, used = key // width, key % width
+        first = np.searchsorted(group, np.arange(len(ready)))
+        color[ready] = np.bincount(group[used == np.arange(len(key)) - first[group]], minlength=len(ready))
+        later = heads[~before]
+        np.subtract.at(pending, later, 1)
+        candidates = np.unique(later)
+        ready = candidates[pending[candidates] == 0]
+    return color
+
+def welch_powell_arrays(n, indptr, indices):
+    """Welch-Powell sur listes d'adjacence CSR : même coloration que welch_powell"""
+    return greedy_coloring(n, indptr, indices, degree_order(np.diff(indptr)))
+
+def dsatur(n, indptr, indices):
+    """DSatur (Brélaz) : on colore à chaque étape le sommet non coloré de saturation maximale
+    (nombre de couleurs distinctes parmi ses voisins), à égalité celui de plus grand degré.
+
+    Les sommets sont rangés dans une file de priorité par niveau de saturation (clé : degré décroissant,
+    puis indice) ; une entrée devient périmée quand sa saturation augmente. Les couleurs des voisins
+    sont des ensembles de bits, d'où la plus petite couleur libre en O(1). O((V + E) log V).
+    """
+    degree = np.diff(indptr).tolist()
+    start = indptr.tolist()
+    neighbors = indices.tolist()
+    color = [-1] * n
+    used = [0] * n
+    saturation = [0] * n
+    buckets = [[] for _ in range(max(degree, default=0) + 2)]
+    buckets[0] = [(-d, vertex) for vertex, d in enumerate(degree)]
+    heapq.heapify(buckets[0])
+    top = 0
+    for _ in range(n):
+        while True:
+            while not buckets[top]:
+                top -= 1
+            _, vertex = heapq.heappop(buckets[top])
+            if color[vertex] < 0 and saturation[vertex] == top:
+                break
+        forbidden = used[vertex]
+        c = (~forbidden & (forbidden + 1)).bit_length() - 1
+        color[vertex] = c
+        bit = 1 << c
+        for w in neighbors[start[vertex]:start[vertex + 1]]:
+            if color[w] < 0 and not used[w] & bit:
+                used[w] |= bit
+                level = saturation[w] + 1
+                saturation[w] = level
+                heapq.heappush(buckets[level], (-degree[w], w))
+                if level > top:
+                    top = level
+    return np.array(color, dtype=np.int64)
+
+def smallest_last_order(n, indptr, indices):
+    """Ordre du dernier plus petit (dégénérescence) : on retire à chaque étape un sommet de degré minimal
+    dans le graphe restant, puis on colore dans l'ordre inverse des retraits.
+
+    Les sommets sont rangés par degré courant dans un tableau découpé en paniers (Batagelj-Zaversnik) :
+    retirer une arête déplace un sommet d'un panier en O(1), d'où O(V + E).
+    Retourne (ordre, dégénérescence).
+    """
+    degree = np.diff(indptr).tolist()
+    start = indptr.tolist()
+    neighbors = indices.tolist()
+    # Début de chaque panier de degré dans vertices, et position de chaque sommet
+    bins = np.concatenate(([0], np.cumsum(np.bincount(degree, minlength=1))[:-1])).tolist()
+    vertices = degree_order(np.diff(indptr))[::-1].tolist()
+    position = [0] * n
+    for i, vertex in enumerate(vertices):
+        position[vertex] = i
+    degeneracy = 0
+    for i in range(n):
+        vertex = vertices[i]
+        d = degree[vertex]
+        if d > degeneracy:
+            degeneracy = d
+        for w in neighbors[start[vertex]:start[vertex + 1]]:
+            dw = degree[w]
+            if dw > d:
+                # w passe en tête de son panier, qui est ensuite raccourci d'une case
+                first = bins[dw]
+                u = vertices[first]
+                if u != w:
+                    pw = position[w]
+                    vertices[first], vertices[pw] = w, u
+                    position[w], position[u] = first, pw
+                bins[dw] = first + 1
+                degree[w] = dw - 1
+    return np.array(vertices[::-1], dtype=np.int64), degeneracy
+
+def smallest_last_coloring(n, indptr, indices):
+    order, _ = smallest_last_order(n, indptr, indices)
+    return greedy_coloring(n, indptr, indices, order)
+
+COLORING_ENGINES = {
+    "Welch-Powell": welch_powell_arrays,
+    "DSatur": dsatur,
+    "Smallest-last": smallest_last_coloring,
+}
+
+def greedy_clique(n, indptr, indices, deadline=None, stop=None):
+    """Clique gloutonne : depuis chaque sommet, par degré décroissant, on ajoute ses voisins du plus
+    grand au plus petit degré s'ils sont adjacents à toute la clique. Retourne la plus grande trouvée.
+
+    Au plus CLIQUE_MAX_STARTS sommets de départ sont essayés, et la recherche s'interrompt à
+    l'instant deadline (time.perf_counter) ou quand stop est levé."""
+    degree = np.diff(indptr)
+    order = degree_order(degree)
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+    # Voisins communs marqués avec l'estampille du sommet ajouté, sans remise à zéro
+    mark = np.zeros(n, dtype=np.int64)
+    stamp = 0
+    best = []
+    for vertex in order[:CLIQUE_MAX_STARTS].tolist():
+        # Une clique contenant ce sommet a au plus degré + 1 sommets
+        if degree[vertex] + 1 <= len(best):
+            break
+        if (deadline is not None and time.perf_counter() > deadline) or (stop is not None and stop.is_set()):
+            break
+        clique = [vertex]
+        common = indices[indptr[vertex]:indptr[vertex + 1]]
+        common = common[np.argsort(rank[common])]
+        while len(common) and len(clique) + len(common) > len(best):
+            w = int(common[0])
+            clique.append(w)
+            stamp += 1
+            mark[indices[indptr[w]:indptr[w + 1]]] = stamp
+            common = common[mark[common] == stamp]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+def exact_coloring(n, indptr, indices, time_budget=EXACT_TIME_BUDGET, stop=None, initial=None):
+    """Nombre chromatique exact par séparation et évaluation DSatur.
+
+    La borne supérieure part de la coloration initial (par défaut Welch-Powell ; la première descente
+    de la recherche est ensuite une coloration DSatur), la borne inférieure d'une clique gloutonne,
+    dont les sommets reçoivent d'office les couleurs 0..k-1. À chaque nœud, on colore le sommet
+    de saturation maximale ; une nouvelle couleur n'est essayée que sous le numéro suivant
+    la plus grande déjà utilisée (symétries entre couleurs), et seulement si elle reste sous la
+    meilleure solution. La recherche, préparation comprise, s'arrête après time_budget secondes
+    ou quand stop est levé.
+
+    Retourne (meilleure coloration, borne inférieure, borne supérieure, statistiques).
+    """
+    start_time = time.perf_counter()
+    deadline = start_time + time_budget
+
+    def expired():
+        return time.perf_counter() > deadline or (stop is not None and stop.is_set())
+
+    best = np.asarray(initial) if initial is not None else welch_powell_arrays(n, indptr, indices)
+    upper = int(best.max(initial=-1)) + 1
+    clique = greedy_clique(n, indptr, indices, deadline, stop)
+    lower = max(len(clique), min(n, 1), 2 if len(indices) else 0)
+    stats = {'nodes': 0, 'clique': clique, 'optimal': lower >= upper}
+    if lower >= upper or expired():
+        stats['seconds'] = time.perf_counter() - start_time
+        return best, lower, upper, stats
+
+    degree = np.diff(indptr).tolist()
+    start = indptr.tolist()
+    # Liste plate des voisins (entiers 32 bits) : pas d'objet Python par arête
+    neighbors = array('i', indices.astype(np.int32).tobytes())
+    color = [-1] * n
+    # counts[v][c] : nombre de voisins de v de couleur c ; saturation[v] : nombre de couleurs distinctes
+    counts = [[0] * upper for _ in range(n)]
+    saturation = [0] * n
+
+    def assign(vertex, c):
+        color[vertex] = c
+        for w in neighbors[start[vertex]:start[vertex + 1]]:
+            row = counts[w]
+            if row[c] == 0:
+                saturation[w] += 1
+            row[c] += 1
+
+    def unassign(vertex):
+        c = color[vertex]
+        color[vertex] = -1
+        for w in neighbors[start[vertex]:start[vertex + 1]]:
+            row = counts[w]
+            row[c] -= 1
+            if row[c] == 0:
+                saturation[w] -= 1
+
+    def select():
+        return max((v for v in range(n) if color[v] < 0), key=lambda v: (saturation[v], degree[v]))
+
+    timed_out = False
+    for c, vertex in enumerate(clique):
+        assign(vertex, c)
+        if expired():
+            timed_out = True
+            break
+    colored = len(clique)
+    # Pile de nœuds : [sommet, prochaine couleur à essayer, couleurs utilisées avant lui]
+    stack = [[select(), 0, len(clique)]] if colored < n and not timed_out else []
+    while stack:
+        stats['nodes'] += 1
+        if expired():
+            timed_out = True
+            break
+        frame = stack[-1]
+        vertex, c, used = frame
+        if color[vertex] >= 0:
+            unassign(vertex)
+            colored -= 1
+        # Couleurs permettant encore de descendre sous upper ; au plus une nouvelle couleur
+        limit = min(used + 1, upper - 1)
+        row = counts[vertex]
+        while c < limit and row[c]:
+            c += 1
+        if c >= limit:
+            stack.pop()
+            continue
+        frame[1] = c + 1
+        assign(vertex, c)
+        colored += 1
+        if colored == n:
+            upper = max(used, c + 1)
+            best = np.array(color, dtype=np.int64)
+            if upper <= lower:
+                break
+            continue
+        stack.append([select(), 0, max(used, c + 1)])
+
+    stats['optimal'] = not timed_out
+    if not timed_out:
+        lower = upper
+    stats['seconds'] = time.perf_counter() - start_time
+    return best, lower, upper, stats
+
+def compare_colorings(n, indptr, indices, engines=COLORING_ENGINES):
+    """Colore le graphe avec chaque moteur ; retourne {nom: (couleurs, durée en secondes)}"""
+    results = {}
+    for name, engine in engines.items():
+        start_time = time.perf_counter()
+        couleurs = engine(n, indptr, indices)
+        results[name] = (couleurs, time.perf_counter() - start_time)
+    return results
 
 def welch_powell(G):
     sommets_tries = sorted(G.nodes(), key=lambda x: G.degree(x), reverse=True)
@@ -36,9 +364,6 @@ def appliquer_couleurs(ax, G, coloration):
             node_size=1000, font_size=12, font_color='#2C3E50',
             edge_color='#E0E0E0', width=2)
 
-def nombre_chromatique(coloration):
-    return max(coloration.values()) + 1
-
 class WelchPowellApp:
     def __init__(self, parent):
         self.parent = parent
@@ -57,6 +382,14 @@ class WelchPowellApp:
         }
         
         self.top.configure(bg=self.colors['bg'])
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.future = None
+        # Dernier graphe coloré (nombre de sommets, u, v) et colorations par moteur
+        self.graph = None
+        self.colorings = {}
+        # Arrêt de la recherche exacte en cours
+        self.exact_future = None
+        self.exact_stop = threading.Event()
         self.setup_interface()
 
         # Added this if the user clicks on x to close the window
@@ -64,6 +397,8 @@ class WelchPowellApp:
 
     def return_home(self):
         """Close the Toplevel and re-show the main window"""
+        self.exact_stop.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.top.destroy()
         self.parent.deiconify()
 
@@ -162,6 +497,55 @@ class WelchPowellApp:
                                cursor="hand2")
         self.run_button.grid(row=0, column=2, sticky='e', padx=(10, 0))
 
+        # Tous les moteurs sont exécutés ; celui choisi ici est dessiné
+        Label(input_frame,
+              text="Engine",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).grid(row=1, column=0, padx=(0, 10), pady=(10, 0), sticky='w')
+
+        self.engine_var = StringVar(value="Welch-Powell")
+        self.engine_combo = ttk.Combobox(input_frame,
+                                         textvariable=self.engine_var,
+                                         values=list(COLORING_ENGINES),
+                                         state="readonly",
+                                         width=20)
+        self.engine_combo.grid(row=1, column=1, pady=(10, 0), sticky='w')
+        self.engine_combo.bind("<<ComboboxSelected>>", lambda event: self.show_coloring())
+
+        # Nombre chromatique exact du graphe courant, dans la limite du temps donné
+        Label(input_frame,
+              text="Time budget (s)",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).grid(row=2, column=0, padx=(0, 10), pady=(10, 0), sticky='w')
+
+        self.budget_entry = Entry(input_frame,
+                                  font=("Helvetica Neue", 14),
+                                  bd=0,
+                                  bg=self.colors['accent'],
+                                  fg=self.colors['secondary'],
+                                  insertbackground=self.colors['primary'],
+                                  relief="flat",
+                                  width=10)
+        self.budget_entry.insert(0, f"{EXACT_TIME_BUDGET:g}")
+        self.budget_entry.grid(row=2, column=1, pady=(10, 0), sticky="w")
+
+        self.exact_button = Button(input_frame,
+                                   text="Exact Chromatic Number",
+                                   command=self.run_exact,
+                                   font=("Helvetica Neue", 12, "bold"),
+                                   bg=self.colors['rose'],
+                                   fg="white",
+                                   activebackground=self.colors['secondary'],
+                                   activeforeground="white",
+                                   relief="flat",
+                                   bd=0,
+                                   padx=20,
+                                   pady=10,
+                                   cursor="hand2")
+        self.exact_button.grid(row=2, column=2, sticky='e', padx=(10, 0), pady=(10, 0))
+
     def create_result_section(self):
         self.result_var = StringVar()
         self.result_var.set("Ready to generate graph")
@@ -192,22 +576,115 @@ class WelchPowellApp:
             self.result_var.set("Generating graph...")
             self.main_container.update()
 
-            random_graph = generate_random_graph(num_vertices)
-            start_time = time.time()
-            coloration = welch_powell(random_graph)
-            end_time = time.time()
-            chromatic_number = nombre_chromatique(coloration)
-
-            self.result_var.set(
-                f"Chromatic number: {chromatic_number} │ Execution time: {end_time - start_time:.3f}s")
+            # La recherche exacte sur le graphe précédent est abandonnée
+            self.exact_stop.set()
+            self.exact_future = None
 
-            self.draw_graph(random_graph, coloration)
+            u, v = generate_random_arrays(num_vertices)
+            indptr, indices = adjacency_arrays(num_vertices, u, v)
+            self.graph = (num_vertices, u, v, indptr, indices)
+            self.colorings = {}
+            self.result_var.set(f"Coloring {num_vertices} vertices, {len(u)} edges with "
+                                f"{', '.join(COLORING_ENGINES)}...")
+            self.future = self.executor.submit(compare_colorings, num_vertices, indptr, indices)
+            self.top.after(100, self.poll_colorings, self.future)
 
         except ValueError as e:
             self.result_var.set(f"Error: {str(e)}")
         except Exception as e:
             self.result_var.set(f"An error occurred: {str(e)}")
 
+    def poll_colorings(self, future):
+        if future is not self.future:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_colorings, future)
+            return
+        try:
+            self.colorings = future.result()
+        except MemoryError as e:
+            self.result_var.set(f"An error occurred: {str(e)}")
+            return
+
+        num_vertices, u, _, _, _ = self.graph
+        self.result_var.set(
+            " │ ".join(f"{name}: {int(couleurs.max(initial=-1)) + 1} colors in {seconds:.3f}s"
+                       for name, (couleurs, seconds) in self.colorings.items())
+            + f"\n{num_vertices} vertices, {len(u)} edges")
+        self.show_coloring()
+
+    def show_coloring(self):
+        """Dessine la coloration du moteur choisi ; le graphe networkx n'est construit que pour l'affichage"""
+        if self.engine_var.get() not in self.colorings:
+            return
+        couleurs, _ = self.colorings[self.engine_var.get()]
+        self.draw_coloring(couleurs)
+
+    def draw_coloring(self, couleurs):
+        num_vertices, u, v, _, _ = self.graph
+        if num_vertices <= MAX_DRAW_VERTICES:
+            random_graph = nx.Graph()
+            random_graph.add_nodes_from(range(num_vertices))
+            random_graph.add_edges_from(zip(u.tolist(), v.tolist()))
+            self.draw_graph(random_graph, dict(enumerate(couleurs.tolist())))
+        else:
+            self.show_too_large(num_vertices, len(u))
+
+    def run_exact(self):
+        try:
+            if self.graph is None:
+                raise ValueError("Generate a graph first")
+            budget = float(self.budget_entry.get())
+            if budget <= 0:
+                raise ValueError("The time budget must be positive")
+        except ValueError as e:
+            self.result_var.set(f"Error: {str(e)}")
+            return
+
+        # Une recherche précédente encore en cours est abandonnée
+        self.exact_stop.set()
+        self.exact_stop = threading.Event()
+        num_vertices, _, _, indptr, indices = self.graph
+        self.result_var.set(f"Searching the chromatic number of {num_vertices} vertices "
+                            f"(at most {budget:g}s)...")
+        # La meilleure coloration déjà calculée sert de borne supérieure de départ
+        initial = min((couleurs for couleurs, _ in self.colorings.values()),
+                      key=lambda couleurs: couleurs.max(initial=-1), default=None)
+        self.exact_future = self.executor.submit(exact_coloring, num_vertices, indptr, indices,
+                                                 budget, self.exact_stop, initial)
+        self.top.after(100, self.poll_exact, self.exact_future, self.graph)
+
+    def poll_exact(self, future, graph):
+        if future is not self.exact_future or graph is not self.graph:
+            return
+        if not future.done():
+            self.top.after(100, self.poll_exact, future, graph)
+            return
+        try:
+            couleurs, lower, upper, stats = future.result()
+        except MemoryError as e:
+            self.result_var.set(f"An error occurred: {str(e)}")
+            return
+
+        if stats['optimal']:
+            self.result_var.set(f"Chromatic number: {upper} (optimal) │ {stats['nodes']} nodes in "
+                                f"{stats['seconds']:.3f}s")
+        else:
+            self.result_var.set(f"Chromatic number between {lower} and {upper} │ time budget reached after "
+                                f"{stats['nodes']} nodes ({stats['seconds']:.3f}s)\n"
+                                f"lower bound: clique of {len(stats['clique'])} vertices, "
+                                f"best coloring shown uses {upper} colors")
+        self.draw_coloring(couleurs)
+
+    def show_too_large(self, num_vertices, num_edges):
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
+        Label(self.graph_frame,
+              text=f"Graph too large to draw ({num_vertices} vertices, {num_edges} edges)",
+              font=("Helvetica Neue", 12),
+              bg=self.colors['bg'],
+              fg=self.colors['secondary']).pack(pady=20)
+
     def draw_graph(self, graph, coloration):
         # Nettoyer le frame précédent
         for widget in self.graph_frame.winfo_children():
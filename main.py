@@ -1,3 +1,4 @@
+import multiprocessing
 import tkinter as tk
 from welcome import WelcomeScreen
 
@@ -15,4 +16,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Required for the process pools when packaged with PyInstaller
+    multiprocessing.freeze_support()
     main()